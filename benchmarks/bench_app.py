@@ -0,0 +1,215 @@
+"""Benchmark the app's load, filter, query and render paths headless.
+
+Each stage runs outside Streamlit against each state's full filing set in
+``Outputs/`` and against synthetic partitions 10x/100x its size (see
+``signaldeck.synthetic``). The partitions are written as CSVs to a
+temporary directory, so the load stages see real files. For every stage
+the best wall time and the peak Python heap (tracemalloc, which covers
+NumPy and pandas buffers but not memory-mapped Arrow files) are reported.
+
+Results can be appended to a JSON-lines history. Each run is compared
+with the last recorded one for the same stage, dataset and scale, so a
+slowdown shows up before a deploy:
+
+    python benchmarks/bench_app.py [--scales 1 10 100] [--record] [--fail-on-regression]
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from signaldeck import charts  # noqa: E402
+from signaldeck.catalog import open_catalog  # noqa: E402
+from signaldeck.concentration import Concentration  # noqa: E402
+from signaldeck.core import APP_COLUMNS  # noqa: E402
+from signaldeck.cube import AggregateCube, merge_metrics  # noqa: E402
+from signaldeck.filter_index import FilterIndex  # noqa: E402
+from signaldeck.gp_rollup import GPRollup, merge_rollups  # noqa: E402
+from signaldeck.name_index import NameIndex, search  # noqa: E402
+from signaldeck.query import parse, plan  # noqa: E402
+from signaldeck.scoring import read_store, score_filings, write_store  # noqa: E402
+from signaldeck.selection import filter_partitions, rank_partitions  # noqa: E402
+from signaldeck.snapshot import build_snapshot, load_snapshot, read_source_csv  # noqa: E402
+from signaldeck.synthetic import Profile, generate  # noqa: E402
+from signaldeck.text_index import TextIndex, relevance, tokenize  # noqa: E402
+from signaldeck.timeseries import build_cube, deployment  # noqa: E402
+
+HISTORY = ROOT / "benchmarks" / "history.jsonl"
+QUERIES = ["largest fast checks in AI hot", "who should I email this week", "cold fintech funds"]
+SECTORS, BUCKETS, MIN_SCORE = [], ["🔥 Hot", "🟡 Warm"], 0.45  # sidebar defaults
+
+# Regressions smaller than this are treated as timer noise.
+MIN_SECONDS = 0.005
+TOLERANCE = 0.20
+
+
+def measure(fn, repeat=3):
+    """``(best seconds, peak bytes, result)`` of ``fn()``."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def stages(csv_path: Path):
+    """``(stage, fn)`` pairs in dependency order; later stages reuse earlier results.
+
+    Stages call the uncached building blocks behind ``signaldeck.core`` and
+    the ``signaldeck.charts`` builders, so every repeat does the full work.
+    """
+    state = {}
+
+    def load():
+        state["df"] = load_snapshot(csv_path, columns=APP_COLUMNS)
+        return state["df"]
+
+    def indexes():
+        df = state["df"]
+        state["index"], state["cube"], state["rollup"] = FilterIndex(df), AggregateCube(df), GPRollup(df)
+        state["series"], state["names"] = build_cube(df), NameIndex(df)
+        state["text"] = TextIndex.from_frame(df)
+
+    def filtered():
+        state["parts"] = [(state["df"], state["index"])]
+        state["filtered"] = filter_partitions(state["parts"], SECTORS, BUCKETS, MIN_SCORE)
+
+    def orders():
+        for column in ("Recent Capital Deployed", "Investor Intent Score"):
+            state[column] = rank_partitions(state["parts"], column, SECTORS, BUCKETS, MIN_SCORE)
+
+    def query():
+        for q in QUERIES:
+            parse.cache_clear()
+            plan(state["filtered"], parse(q))
+
+    def founder_view():
+        return charts.deployment(state["filtered"]).to_json()
+
+    def institutional_view():
+        df = state["filtered"]
+        figures = [
+            charts.deployment_map(df),
+            charts.concentration(Concentration(df["Recent Capital Deployed"].to_numpy()[state["Recent Capital Deployed"]])),
+            charts.gp_influence(merge_rollups([state["rollup"]], SECTORS, BUCKETS, MIN_SCORE)),
+        ]
+        return [f.to_json() for f in figures]
+
+    def advanced_view():
+        df = state["filtered"]
+        figures = [
+            charts.quadrant(df),
+            charts.deployment_time(deployment([state["series"]], SECTORS, BUCKETS, MIN_SCORE)),
+            charts.momentum_size(df),
+            charts.velocity_time(df.iloc[state["Investor Intent Score"][:20]]),
+        ]
+        return [f.to_json() for f in figures]
+
+    return [
+        ("load_csv", lambda: read_source_csv(csv_path)),
+        ("build_snapshot", lambda: build_snapshot(csv_path)),
+        ("load_snapshot", load),
+        ("build_indexes", indexes),
+        ("filter", filtered),
+        ("rank_orders", orders),
+        ("metrics", lambda: merge_metrics([state["cube"]], SECTORS, BUCKETS, MIN_SCORE)),
+        ("query", query),
+        ("name_search", lambda: search([(state["df"], state["names"])], "equity partners")),
+        ("text_search", lambda: relevance(
+            [(state["index"], state["text"])], tokenize("follow-on heavy fintech"), SECTORS, BUCKETS, MIN_SCORE
+        )),
+        ("founder_view", founder_view),
+        ("institutional_view", institutional_view),
+        ("advanced_view", advanced_view),
+    ]
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def last_results(path: Path) -> dict:
+    """Most recent recorded seconds per (dataset, scale, stage)."""
+    latest = {}
+    if path.exists():
+        for line in path.read_text().splitlines():
+            run = json.loads(line)
+            for r in run["results"]:
+                latest[(r["dataset"], r["scale"], r["stage"])] = r["seconds"]
+    return latest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--outputs", type=Path, default=ROOT / "Outputs")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--history", type=Path, default=HISTORY)
+    parser.add_argument("--record", action="store_true", help="append this run to the history")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    catalog = open_catalog(args.outputs)
+    full = catalog.filing_sets()
+    profile = Profile([read_store(catalog.path(e)) for e in full])
+    previous = last_results(args.history)
+
+    results, regressions = [], []
+    print(f"{'dataset':<48} {'scale':>5} {'rows':>8} {'stage':<20} {'ms':>9} {'peak MB':>8} {'vs last':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for entry in full:
+            store = read_store(catalog.path(entry))
+            for factor in args.scales:
+                csv_path = Path(tmp) / entry["state"] / f"x{factor}_{Path(entry['path']).name}"
+                csv_path.parent.mkdir(exist_ok=True)
+                rows = len(store) * factor
+                if factor == 1:
+                    write_store(store, csv_path)
+                else:
+                    write_store(score_filings(generate(profile, rows, entry["state"], seed=factor), profile.as_of), csv_path)
+                for stage, fn in stages(csv_path):
+                    seconds, peak, _ = measure(fn, repeat=1 if factor >= 100 else 3)
+                    result = {"dataset": entry["path"], "scale": factor, "rows": rows, "stage": stage,
+                              "seconds": seconds, "peak_bytes": peak}
+                    results.append(result)
+
+                    before = previous.get((entry["path"], factor, stage))
+                    change = ""
+                    if before:
+                        change = f"{seconds / before - 1:+.0%}"
+                        if seconds > before * (1 + TOLERANCE) and seconds - before > MIN_SECONDS:
+                            regressions.append(result)
+                            change += " !"
+                    print(f"{entry['path']:<48} {factor:>5} {rows:>8} {stage:<20} "
+                          f"{seconds * 1000:>9.1f} {peak / 2**20:>8.1f} {change:>8}")
+
+    if args.record:
+        run = {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "revision": git_revision(),
+               "python": platform.python_version(), "machine": platform.machine(), "results": results}
+        with args.history.open("a") as out:
+            out.write(json.dumps(run) + "\n")
+    if regressions:
+        print(f"\n{len(regressions)} stage(s) more than {TOLERANCE:.0%} slower than the last recorded run")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark the scoring engine on the shipped state exports.
+
+Times a full rescore of each state at 1x, 10x and 100x its size (rows are
+replicated with fresh accession numbers and GP names), then all states
+serially versus in a process pool.
+
+    python benchmarks/bench_scoring.py [--scales 1 10 100]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from signaldeck.catalog import FILINGS, INTENT, open_catalog  # noqa: E402
+from signaldeck.scoring import read_store, score_filings, score_paths  # noqa: E402
+
+
+def scaled(store: pd.DataFrame, factor: int) -> pd.DataFrame:
+    if factor == 1:
+        return store
+    copies = []
+    for i in range(factor):
+        copy = store.copy()
+        copy["accession_number"] = copy["accession_number"] + f"-{i}"
+        copy["related_person_name"] = copy["related_person_name"] + f"{i % 7}"
+        copy["index"] = copy["index"] + i * len(store)
+        copies.append(copy)
+    return pd.concat(copies, ignore_index=True)
+
+
+def best_of(fn, repeat=3) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--outputs", type=Path, default=ROOT / "Outputs")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+
+    catalog = open_catalog(args.outputs)
+    entries = [e for e in catalog.entries if e["kind"] in (INTENT, FILINGS) and e["rows"] > 100]
+
+    print(f"{'file':<55} {'scale':>5} {'rows':>9} {'seconds':>9} {'rows/s':>11}")
+    for entry in entries:
+        store = read_store(catalog.path(entry))
+        for factor in args.scales:
+            df = scaled(store, factor)
+            seconds = best_of(lambda: score_filings(df), repeat=1 if factor >= 100 else 3)
+            print(f"{entry['path']:<55} {factor:>5} {len(df):>9} {seconds:>9.3f} {len(df) / seconds:>11,.0f}")
+
+    paths = [catalog.path(e) for e in entries]
+    serial = best_of(lambda: score_paths(paths, check=True, workers=1))
+    parallel = best_of(lambda: score_paths(paths, check=True))
+    print(f"\nall states, serial:   {serial:.3f} s")
+    print(f"all states, parallel: {parallel:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
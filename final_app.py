@@ -1,10 +1,24 @@
+import os
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
 from pathlib import Path
-import re
+
+from signaldeck import charts
+from signaldeck.catalog import manifest_version
+from signaldeck.core import (
+    load_answer,
+    load_catalog,
+    load_concentration,
+    load_deployment,
+    load_figure_cache,
+    load_filtered,
+    load_gp_table,
+    load_metrics,
+    load_name_search,
+    load_top_funds,
+    select_partitions,
+)
+from signaldeck.query import BLEND_WEIGHTS, parse
+from signaldeck.timeseries import PERIODS, WINDOWS
 
 # Page configuration
 st.set_page_config(
@@ -22,70 +36,52 @@ h1, h2, h3 { font-family: Inter, sans-serif; }
 """, unsafe_allow_html=True)
 
 ROOT = Path(__file__).resolve().parent
-BASE_PATH = ROOT / "Outputs"
-
-STATE_FOLDERS = {
-    "CA": BASE_PATH / "CA",
-    "NY": BASE_PATH / "NY",
-    "MA": BASE_PATH / "MA",
-    "TX": BASE_PATH / "TX",
-}
-
-CSV_NAME = "SEC_FORMD_2025_VC_INVESTOR_INTENT_FINAL.csv"
-
-@st.cache_data(show_spinner=False)
-def load_state_csv(state: str) -> pd.DataFrame:
-    path = STATE_FOLDERS[state] / CSV_NAME
-    if not path.exists():
-        st.error(f"Missing data file for {state}")
-        st.stop()
+# SIGNALDECK_OUTPUTS points the app at another export tree, e.g. synthetic data
+BASE_PATH = Path(os.environ.get("SIGNALDECK_OUTPUTS", ROOT / "Outputs"))
 
-    df = pd.read_csv(path, parse_dates=["filing_date"])
-    df = df.rename(columns={
-        "issuer_name": "Fund Name",
-        "issuer_state": "State",
-        "fund_vertical": "Sector",
-        "intent_bucket": "Intent Bucket",
-        "actively_deploying": "Actively Deploying",
-        "offering_amount_total": "Total Fund Size",
-        "total_amount_sold": "Lifetime Capital Deployed",
-        "decayed_amount_sold": "Recent Capital Deployed",
-        "sale_velocity": "Capital Velocity",
-        "sale_acceleration": "Capital Acceleration",
-        "fund_momentum": "Fund Momentum",
-        "investor_intent_score": "Investor Intent Score",
-        "related_person_name": "GP Name",
-        "number_of_investors": "Investor Count",
-        "why_investor": "Why This Investor",
-        "days_since_filing": "Days Since Filing",
-        "filing_date": "Filing Date"
-    })
-    return df
+ALL_STATES = "All States"
+MULTIPLE_STATES = "Multiple States"
+
+catalog = load_catalog(str(BASE_PATH), manifest_version(BASE_PATH))
+if not catalog.states():
+    st.error(f"No datasets found under {BASE_PATH}")
+    st.stop()
 
 # Sidebar
 st.sidebar.header("Settings")
-state = st.sidebar.selectbox("Select State", list(STATE_FOLDERS.keys()))
+state = st.sidebar.selectbox(
+    "Select State",
+    catalog.states() + [ALL_STATES, MULTIPLE_STATES]
+)
+if state == ALL_STATES:
+    states = catalog.states()
+elif state == MULTIPLE_STATES:
+    states = st.sidebar.multiselect("States", catalog.states())
+    if not states:
+        st.info("Select one or more states.")
+        st.stop()
+else:
+    states = [state]
+years = sorted({y for s in states for y in catalog.years(s)})
+if len(years) > 1:
+    year = st.sidebar.selectbox("Year", years, index=len(years) - 1)
+else:
+    year = years[-1]
 view = st.sidebar.radio(
     "View Mode",
     ["Founder View", "Institutional View", "Advanced Market Analytics"],
     index=0
 )
 
-df = load_state_csv(state)
-
-# GP name normalization
-df["GP Name"] = (
-    df["GP Name"]
-    .astype(str)
-    .str.replace(r"([a-z])([A-Z])", r"\1 \2", regex=True)
-    .str.replace("_", " ")
-    .str.title()
-    .str.strip()
-)
+entries = [e for e in (catalog.filing_set(s, year) for s in states) if e is not None]
+missing = [e["state"] for e in entries if not catalog.path(e).exists()]
+if missing:
+    st.error(f"Missing data file for {', '.join(missing)}")
+    st.stop()
 
 sector_filter = st.sidebar.multiselect(
     "Sector",
-    sorted(df["Sector"].dropna().unique())
+    catalog.sectors(entries)
 )
 
 intent_filter = st.sidebar.multiselect(
@@ -99,24 +95,55 @@ min_score = st.sidebar.slider(
     0.0, 1.0, 0.45, 0.05
 )
 
-# Apply filters
-filtered = df.copy()
-if sector_filter:
-    filtered = filtered[filtered["Sector"].isin(sector_filter)]
-if intent_filter:
-    filtered = filtered[filtered["Intent Bucket"].isin(intent_filter)]
-filtered = filtered[filtered["Investor Intent Score"] >= min_score]
+# Blend used when a query asks for the largest fast checks
+with st.sidebar.expander("Ranking Weights"):
+    blend_weights = tuple(
+        (col, st.slider(label, 0.0, 1.0, default, 0.05))
+        for label, (col, default) in zip(["Capital Deployed", "Velocity", "Intent Score"], BLEND_WEIGHTS)
+    )
+
+# Name lookup over the selected states, independent of the filters below
+name_query = st.text_input("Find a Fund or GP", placeholder="e.g. equityzen, paul graham")
+if name_query:
+    matches = load_name_search(select_partitions(catalog, states, year), name_query)
+    if matches.empty:
+        st.info("No fund or GP names match.")
+    else:
+        st.dataframe(
+            matches[[
+                "Match",
+                "Match Type",
+                "Fund Name",
+                "GP Name",
+                "Sector",
+                "Intent Bucket",
+                "Investor Intent Score",
+                "Recent Capital Deployed"
+            ]],
+            use_container_width=True
+        )
+
+# Apply filters: skip partitions the manifest rules out, then let each
+# partition's index visit only the rows above the score cut-off
+partitions = select_partitions(catalog, states, year, sector_filter, intent_filter, min_score)
+filtered = load_filtered(partitions, tuple(sector_filter), tuple(intent_filter), min_score)
 
 if filtered.empty:
     st.warning("No investors matched to the selected filters.")
     st.stop()
 
+# Figures depend only on the data version, the filters and the view, so
+# unrelated widget changes and view switches reuse them
+figures = load_figure_cache()
+figure_key = (partitions, tuple(sorted(sector_filter)), tuple(sorted(intent_filter)), min_score, view)
+
 # Metrics
+metrics = load_metrics(partitions, tuple(sector_filter), tuple(intent_filter), min_score)
 c1, c2, c3, c4 = st.columns(4)
-c1.metric("Active Funds", int(filtered["Actively Deploying"].sum()))
-c2.metric("Recent Capital", f"${filtered['Recent Capital Deployed'].sum():,.0f}")
-c3.metric("Median Intent Score", f"{filtered['Investor Intent Score'].median():.2f}")
-c4.metric("Unique Funds", filtered["Fund Name"].nunique())
+c1.metric("Active Funds", metrics.active)
+c2.metric("Recent Capital", f"${metrics.capital:,.0f}")
+c3.metric("Median Intent Score", f"{metrics.median_score:.2f}")
+c4.metric("Unique Funds", metrics.funds)
 
 # Founder View
 if view == "Founder View":
@@ -127,39 +154,11 @@ if view == "Founder View":
         "Try: 'largest fast checks in AI', 'who should I email this week', 'cold fintech funds'"
     )
 
-    temp = filtered.copy()
+    temp = filtered
+    intent = parse(query, blend_weights) if query else None
 
     if query:
-        q = query.lower()
-
-        sector_match = re.search(r"(fintech|saas|ai|crypto|health|climate)", q)
-        if sector_match:
-            sector = sector_match.group(1)
-            temp = temp[temp["Sector"].str.lower().str.contains(sector, na=False)]
-
-        if "largest" in q or "big" in q:
-            temp = temp.sort_values("Recent Capital Deployed", ascending=False)
-
-        if "fast" in q or "quick" in q or "moving" in q:
-            temp = temp.sort_values("Capital Velocity", ascending=False)
-
-        if ("largest" in q) and ("fast" in q or "quick" in q):
-            temp["signal_rank"] = (
-                temp["Recent Capital Deployed"].rank(pct=True) * 0.45 +
-                temp["Capital Velocity"].rank(pct=True) * 0.35 +
-                temp["Investor Intent Score"].rank(pct=True) * 0.20
-            )
-            temp = temp.sort_values("signal_rank", ascending=False)
-
-        if "hot" in q:
-            temp = temp[temp["Intent Bucket"] == "🔥 Hot"]
-        if "warm" in q:
-            temp = temp[temp["Intent Bucket"] == "🟡 Warm"]
-        if "cold" in q:
-            temp = temp[temp["Intent Bucket"] == "❄️ Cold"]
-
-        if "email" in q or "this week" in q or "reach out" in q:
-            temp = temp.head(5)
+        temp = load_answer(partitions, tuple(sector_filter), tuple(intent_filter), min_score, intent)
 
         st.success(f"SignalDeck suggests prioritizing {len(temp)} funds.")
         st.dataframe(
@@ -173,21 +172,7 @@ if view == "Founder View":
             use_container_width=True
         )
 
-    fig = px.scatter(
-        temp.head(50),
-        x="Capital Velocity",
-        y="Recent Capital Deployed",
-        size="Investor Count",
-        color="Intent Bucket",
-        hover_name="Fund Name",
-        title="Active Funds Deployment",
-        color_discrete_map={
-            "🔥 Hot": "#ff6b6b",
-            "🟡 Warm": "#feca57",
-            "❄️ Cold": "#8395a7"
-        },
-        template="plotly_white"
-    )
+    fig = figures.get(figure_key + (intent, "deployment"), lambda: charts.deployment(temp))
     st.plotly_chart(fig, use_container_width=True)
     st.markdown(
         "<div class='caption-text'>Velocity shows how quickly capital is moving into a fund relative to peers.</div>",
@@ -198,62 +183,27 @@ if view == "Founder View":
 elif view == "Institutional View":
     st.subheader("Market Structure & Capital Flow")
 
-    fig = px.scatter(
-        filtered,
-        x="Capital Velocity",
-        y="Recent Capital Deployed",
-        size="Investor Count",
-        color="Intent Bucket",
-        hover_name="Fund Name",
-        title="Capital Deployment Map",
-        color_discrete_map={
-            "🔥 Hot": "#e74c3c",
-            "🟡 Warm": "#f1c40f",
-            "❄️ Cold": "#95a5a6"
-        },
-        template="plotly_white"
-    )
+    fig = figures.get(figure_key + ("deployment_map",), lambda: charts.deployment_map(filtered))
     st.plotly_chart(fig, use_container_width=True)
     st.markdown(
         "<div class='caption-text'>Shows how capital speed and size differ across hot, warm, and cold investors.</div>",
         unsafe_allow_html=True
     )
 
-    sorted_cap = filtered.sort_values("Recent Capital Deployed", ascending=False)["Recent Capital Deployed"]
-    cum_cap = sorted_cap.cumsum() / sorted_cap.sum()
-
-    fig_gini = go.Figure()
-    fig_gini.add_trace(go.Scatter(y=cum_cap, fill="tozeroy", name="Capital Share"))
-    fig_gini.add_trace(go.Scatter(
-        y=np.linspace(0, 1, len(cum_cap)),
-        line=dict(dash="dash"),
-        name="Equality Line"
-    ))
-    fig_gini.update_layout(
-        title="Capital Concentration Curve",
-        template="plotly_white"
-    )
+    concentration = load_concentration(partitions, tuple(sector_filter), tuple(intent_filter), min_score)
+    fig_gini = figures.get(figure_key + ("concentration",), lambda: charts.concentration(concentration))
     st.plotly_chart(fig_gini, use_container_width=True)
     st.markdown(
         "<div class='caption-text'>Reveals how much deployment is concentrated among the most active funds.</div>",
         unsafe_allow_html=True
     )
+    g1, g2 = st.columns(2)
+    g1.metric("Capital Gini", f"{concentration.gini:.2f}")
+    g2.metric("Capital HHI", f"{concentration.hhi:.3f}")
 
-    gp_df = filtered.groupby("GP Name", as_index=False).agg(
-        capital=("Recent Capital Deployed", "sum"),
-        intent=("Investor Intent Score", "mean"),
-        velocity=("Capital Velocity", "mean")
-    )
+    gp_df = load_gp_table(partitions, tuple(sector_filter), tuple(intent_filter), min_score)
 
-    fig_gp = px.scatter(
-        gp_df,
-        x="velocity",
-        y="intent",
-        size="capital",
-        hover_name="GP Name",
-        title="GP Influence & Deployment Power",
-        template="plotly_white"
-    )
+    fig_gp = figures.get(figure_key + ("gp_influence",), lambda: charts.gp_influence(gp_df))
     st.plotly_chart(fig_gp, use_container_width=True)
     st.markdown(
         "<div class='caption-text'>Identifies individual GPs driving capital allocation decisions.</div>",
@@ -265,81 +215,38 @@ else:
     st.subheader("Advanced Market Analytics")
     st.caption("Deep diagnostics on timing, momentum, and investor behavior.")
 
-    x_med = filtered["Days Since Filing"].median()
-    y_med = filtered["Fund Momentum"].median()
-
-    fig_quad = px.scatter(
-        filtered,
-        x="Days Since Filing",
-        y="Fund Momentum",
-        color="Intent Bucket",
-        hover_name="Fund Name",
-        title="Momentum vs Recency",
-        template="plotly_white",
-        color_discrete_map={
-            "🔥 Hot": "#ff6b6b",
-            "🟡 Warm": "#feca57",
-            "❄️ Cold": "#8395a7"
-        }
-    )
-    fig_quad.add_vline(x=x_med, line_dash="dash")
-    fig_quad.add_hline(y=y_med, line_dash="dash")
+    fig_quad = figures.get(figure_key + ("quadrant",), lambda: charts.quadrant(filtered))
     st.plotly_chart(fig_quad, use_container_width=True)
     st.markdown(
         "<div class='caption-text'>Cold funds cluster where momentum and recency are both low.</div>",
         unsafe_allow_html=True
     )
 
-    intent_time = (
-        filtered
-        .groupby(pd.Grouper(key="Filing Date", freq="MS"))["Recent Capital Deployed"]
-        .sum()
-        .reset_index()
-    )
+    p1, p2 = st.columns(2)
+    period = p1.selectbox("Deployment Period", list(PERIODS), index=1)
+    window = p2.selectbox("Rolling Window", list(WINDOWS), index=0)
 
-    fig_time = go.Figure()
-    fig_time.add_bar(
-        x=intent_time["Filing Date"],
-        y=intent_time["Recent Capital Deployed"]
-    )
-    fig_time.update_layout(
-        title="Investor Deployment Over Time",
-        template="plotly_white"
-    )
+    fig_time = figures.get(figure_key + ("deployment_time", period, window), lambda: charts.deployment_time(
+        load_deployment(
+            partitions, tuple(sector_filter), tuple(intent_filter), min_score, PERIODS[period], WINDOWS[window]
+        )
+    ))
     st.plotly_chart(fig_time, use_container_width=True)
     st.markdown(
         "<div class='caption-text'>Tracks market-wide deployment cycles across all intent levels.</div>",
         unsafe_allow_html=True
     )
 
-    fig_momentum = px.scatter(
-        filtered,
-        x="Total Fund Size",
-        y="Fund Momentum",
-        size="Investor Count",
-        color="Capital Velocity",
-        log_x=True,
-        hover_name="Fund Name",
-        title="Fund Momentum vs Fund Size",
-        template="plotly_white"
-    )
+    fig_momentum = figures.get(figure_key + ("momentum_size",), lambda: charts.momentum_size(filtered))
     st.plotly_chart(fig_momentum, use_container_width=True)
     st.markdown(
         "<div class='caption-text'>Separates large but slow funds from smaller, faster allocators.</div>",
         unsafe_allow_html=True
     )
 
-    top_funds = filtered.sort_values("Investor Intent Score", ascending=False).head(20)
-    fig_vel_time = px.scatter(
-        top_funds,
-        x="Filing Date",
-        y="Capital Velocity",
-        size="Total Fund Size",
-        color="Investor Intent Score",
-        hover_name="Fund Name",
-        title="Capital Velocity vs Time (Top Funds)",
-        template="plotly_white"
-    )
+    fig_vel_time = figures.get(figure_key + ("velocity_time",), lambda: charts.velocity_time(
+        load_top_funds(partitions, tuple(sector_filter), tuple(intent_filter), min_score)
+    ))
     st.plotly_chart(fig_vel_time, use_container_width=True)
     st.markdown(
         "<div class='caption-text'>Shows whether high-intent funds are speeding up or cooling off.</div>",
@@ -347,14 +254,8 @@ else:
     )
 
     top_10_pct = int(0.1 * len(filtered))
-    capital_top_10 = (
-        filtered
-        .sort_values("Recent Capital Deployed", ascending=False)
-        .head(top_10_pct)["Recent Capital Deployed"]
-        .sum()
-    )
-    total_cap = filtered["Recent Capital Deployed"].sum()
-    capital_share = capital_top_10 / total_cap if total_cap > 0 else 0
+    concentration = load_concentration(partitions, tuple(sector_filter), tuple(intent_filter), min_score)
+    capital_share = concentration.top_share(top_10_pct)
 
     st.metric("Top 10% Funds Deploy", f"{capital_share:.0%}")
     fast_count = (filtered["Capital Velocity"] >= filtered["Capital Velocity"].quantile(0.9)).sum()
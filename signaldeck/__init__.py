@@ -0,0 +1 @@
+"""Headless data layer behind the SignalDeck apps (entry points in :mod:`signaldeck.core`)."""
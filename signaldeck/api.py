@@ -0,0 +1,275 @@
+"""Local JSON API over the dashboard's selections, on stdlib asyncio.
+
+    python -m signaldeck.api [--port 8765]
+
+Endpoints (GET only). Each takes the sidebar filters as query parameters:
+``state`` (repeatable or comma-separated; default all), ``year`` (default
+latest), ``sector``, ``bucket`` (a label or hot/warm/cold) and
+``min_score``.
+
+    /states               states and their years
+    /metrics              the metrics row, plus the Gini and HHI of capital
+    /funds?q=...&limit=   "Ask SignalDeck" ranking, or the filtered funds without q
+    /gps?limit=           GP rollup, largest capital first
+
+Responses are cached in process under the normalised request: sorted,
+de-duplicated filters, the dataset checksums and the *parsed* query, so
+rewordings with the same intent share an entry. Each response carries a
+strong ETag, and a matching ``If-None-Match`` gets a bodiless 304. Cache
+misses are computed in a worker thread through :mod:`signaldeck.core`, so
+slow requests do not hold up cached ones.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import traceback
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from signaldeck.catalog import manifest_version
+from signaldeck.core import (
+    load_answer,
+    load_catalog,
+    load_concentration,
+    load_filtered,
+    load_gp_table,
+    load_metrics,
+    load_rows,
+    select_partitions,
+)
+from signaldeck.query import parse
+from signaldeck.ranking import nlargest
+
+BUCKETS = {"hot": "🔥 Hot", "warm": "🟡 Warm", "cold": "❄️ Cold"}
+FUND_COLUMNS = [
+    "Fund Name",
+    "GP Name",
+    "Sector",
+    "Intent Bucket",
+    "Investor Intent Score",
+    "Recent Capital Deployed",
+    "Capital Velocity",
+    "Filing Date",
+    "Why This Investor",
+]
+DEFAULT_LIMIT = 100
+CACHE_ENTRIES = 4096
+REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ResponseCache:
+    """LRU map from a normalised request to ``(etag, body)``."""
+
+    def __init__(self, max_entries=CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return entry
+
+    def put(self, key, body: bytes):
+        self.misses += 1
+        entry = (f'"{hashlib.sha256(body).hexdigest()[:32]}"', body)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+
+def _values(params: dict, name: str) -> list:
+    return [v.strip() for raw in params.get(name, []) for v in raw.split(",") if v.strip()]
+
+
+def _bucket(value: str) -> str:
+    label = BUCKETS.get(value.lower(), value)
+    if label not in BUCKETS.values():
+        raise ApiError(400, f"unknown bucket {value!r}")
+    return label
+
+
+def _int(params: dict, name: str, default):
+    values = params.get(name)
+    try:
+        return int(values[-1]) if values else default
+    except ValueError:
+        raise ApiError(400, f"{name} must be an integer") from None
+
+
+def _scalar(value):
+    # NumPy scalars to plain Python numbers for json, NaN to null
+    value = value.item() if hasattr(value, "item") else value
+    return None if isinstance(value, float) and math.isnan(value) else value
+
+
+def normalize(catalog, endpoint: str, params: dict) -> tuple:
+    """Cache key for a request: canonical filters plus the data they resolve to."""
+    states = sorted(set(_values(params, "state"))) or catalog.states()
+    unknown = set(states) - set(catalog.states())
+    if unknown:
+        raise ApiError(404, f"no datasets for {', '.join(sorted(unknown))}")
+    year = _int(params, "year", max(y for s in states for y in catalog.years(s)))
+    sectors = tuple(sorted(set(_values(params, "sector"))))
+    buckets = tuple(sorted({_bucket(b) for b in _values(params, "bucket")}))
+    try:
+        min_score = float(params.get("min_score", ["0"])[-1])
+    except ValueError:
+        raise ApiError(400, "min_score must be a number") from None
+    if not math.isfinite(min_score):
+        raise ApiError(400, "min_score must be a finite number")
+
+    partitions = select_partitions(catalog, states, year, sectors, buckets, min_score)
+    query = " ".join(params.get("q", [])).strip()
+    intent = parse(query) if endpoint == "/funds" and query else None
+    limit = _int(params, "limit", DEFAULT_LIMIT) if endpoint in ("/funds", "/gps") else None
+    if limit is not None and limit < 0:
+        raise ApiError(400, "limit must be non-negative")
+    return endpoint, tuple(states), year, partitions, sectors, buckets, min_score, intent, limit
+
+
+def compute(key: tuple):
+    """JSON-ready result for a normalised request."""
+    endpoint, states, year, partitions, sectors, buckets, min_score, intent, limit = key
+    selection = {"states": list(states), "year": year, "sectors": list(sectors),
+                 "buckets": list(buckets), "min_score": min_score}
+    if not any(len(rows) for rows in load_rows(partitions, sectors, buckets, min_score)):
+        # Nothing matches: the aggregates below all expect at least one row
+        if endpoint == "/metrics":
+            metrics = {"active": 0, "capital": 0.0, "median_score": None, "funds": 0, "gini": 0.0, "hhi": 0.0}
+            return {"selection": selection, "metrics": metrics}
+        if endpoint == "/funds":
+            return {"selection": selection, "query": intent._asdict() if intent else None, "total": 0, "funds": []}
+        return {"selection": selection, "total": 0, "gps": []}
+    if endpoint == "/metrics":
+        metrics = load_metrics(partitions, sectors, buckets, min_score)._asdict()
+        concentration = load_concentration(partitions, sectors, buckets, min_score)
+        metrics.update(gini=concentration.gini, hhi=concentration.hhi)
+        return {"selection": selection, "metrics": {k: _scalar(v) for k, v in metrics.items()}}
+    if endpoint == "/funds":
+        if intent is not None:
+            rows = load_answer(partitions, sectors, buckets, min_score, intent)
+        else:
+            rows = load_filtered(partitions, sectors, buckets, min_score)
+        total = len(rows)
+        rows = rows[FUND_COLUMNS].head(limit) if total else rows
+        records = json.loads(rows.to_json(orient="records", date_format="iso")) if total else []
+        return {"selection": selection, "query": intent._asdict() if intent else None, "total": total, "funds": records}
+    gp_df = load_gp_table(partitions, sectors, buckets, min_score)
+    return {"selection": selection, "total": len(gp_df),
+            "gps": json.loads(nlargest(gp_df, "capital", limit).to_json(orient="records"))}
+
+
+class Api:
+    def __init__(self, base_path: Path):
+        self.base_path = Path(base_path)
+        self.cache = ResponseCache()
+
+    def catalog(self):
+        return load_catalog(str(self.base_path), manifest_version(self.base_path))
+
+    async def respond(self, method: str, target: str, headers: dict) -> tuple:
+        """``(status, etag, body)`` for one request."""
+        if method != "GET":
+            raise ApiError(405, "only GET is supported")
+        url = urlsplit(target)
+        catalog = self.catalog()
+        if url.path == "/health":
+            return 200, None, b'{"status": "ok"}'
+        if url.path == "/states":
+            body = {s: catalog.years(s) for s in catalog.states()}
+            return 200, None, json.dumps(body).encode()
+        if url.path not in ("/metrics", "/funds", "/gps"):
+            raise ApiError(404, f"no endpoint {url.path}")
+
+        key = normalize(catalog, url.path, parse_qs(url.query))
+        entry = self.cache.get(key)
+        if entry is None:
+            result = await asyncio.get_running_loop().run_in_executor(None, compute, key)
+            body = json.dumps(result, default=str, ensure_ascii=False, allow_nan=False)
+            entry = self.cache.put(key, body.encode())
+        etag, body = entry
+        if etag in (t.strip() for t in headers.get("if-none-match", "").split(",")):
+            return 304, etag, b""
+        return 200, etag, body
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    break
+                # discard any body so it is not read as the next request; only
+                # GETs are served, so anything else also ends the connection
+                if length > 0:
+                    await reader.readexactly(length)
+                try:
+                    status, etag, body = await self.respond(method, target, headers)
+                except ApiError as exc:
+                    status, etag, body = exc.status, None, json.dumps({"error": str(exc)}).encode()
+                except Exception:
+                    traceback.print_exc()
+                    status, etag, body = 500, None, b'{"error": "internal error"}'
+
+                keep_alive = (headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                              and method == "GET" and "transfer-encoding" not in headers)
+                head = [f"HTTP/1.1 {status} {REASONS[status]}", "Content-Type: application/json; charset=utf-8",
+                        f"Content-Length: {len(body)}", "Cache-Control: no-cache",
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+                if etag:
+                    head.append(f"ETag: {etag}")
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(base_path: Path, host="127.0.0.1", port=8765):
+    api = Api(base_path)
+    server = await asyncio.start_server(api.handle, host, port)
+    print(f"serving {base_path} on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--outputs", type=Path, default=Path(__file__).resolve().parent.parent / "Outputs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    asyncio.run(serve(args.outputs, args.host, args.port))
@@ -0,0 +1,27 @@
+"""Atomic file replacement for everything written next to the datasets.
+
+Snapshots, cubes, indexes, stores, the manifest and rendered charts are
+written to a temporary file in the same folder and moved over the target
+with ``os.replace``. Readers never see a partial file, and processes
+still mapping the old one keep a valid view.
+"""
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def replacing(path: Path):
+    """Yield a temporary path that replaces ``path`` when the block succeeds.
+
+    If the block raises, the temporary file is removed and ``path`` is
+    left as it was.
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        yield tmp
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    os.replace(tmp, path)
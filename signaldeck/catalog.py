@@ -0,0 +1,217 @@
+"""Catalog of the Form D datasets under ``Outputs/``.
+
+Every ``<STATE>/<file>.csv`` is described once in a JSON manifest
+(``Outputs/catalog.json``): state, kind, filing years, row count, column
+schema, checksum and, for filing-level files, the sectors, intent buckets
+and maximum intent score present (used to prune partitions). Opening the
+catalog reads only that manifest, so startup cost does not grow with the
+number of states or years; partitions are parsed lazily when a view asks
+for them. Run ``python -m signaldeck.catalog`` after adding or replacing
+files.
+
+The state always comes from the folder and the kind from the file name
+suffix, so files such as ``MA/SEC_FORMD_2025_CA_VC_GP_STRENGTH.csv`` are
+filed under MA regardless of the state token in their name.
+"""
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from signaldeck.atomic import replacing
+
+MANIFEST_NAME = "catalog.json"
+MANIFEST_VERSION = 2
+
+INTENT = "intent"
+FILINGS = "filings"
+GP_STRENGTH = "gp_strength"
+TOP20 = "top20"
+
+KIND_PATTERNS = [
+    (re.compile(r"_VC_INVESTOR_INTENT_FINAL\.csv$"), INTENT),
+    (re.compile(r"_VC_GP_STRENGTH\.csv$"), GP_STRENGTH),
+    (re.compile(r"_VC_TOP20_YC_READY\.csv$"), TOP20),
+    (re.compile(r"\.csv$"), FILINGS),
+]
+YEAR_PATTERN = re.compile(r"SEC_FORMD_(\d{4})_")
+STATE_PATTERN = re.compile(r"^[A-Z]{2}$")
+
+
+def _kind(name: str) -> str:
+    return next(kind for pattern, kind in KIND_PATTERNS if pattern.search(name))
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def describe(base_path: Path, csv_path: Path) -> dict:
+    """Manifest entry for one dataset file (parses the file once)."""
+    df = pd.read_csv(csv_path, dtype={"cik": str, "accession_number": str})
+    name_year = YEAR_PATTERN.search(csv_path.name)
+    if "filing_date" in df:
+        years = sorted(pd.to_datetime(df["filing_date"]).dt.year.dropna().unique().tolist())
+    else:
+        years = []
+    if not years and name_year:
+        years = [int(name_year.group(1))]
+
+    stat = csv_path.stat()
+    entry = {
+        "path": csv_path.relative_to(base_path).as_posix(),
+        "state": csv_path.parent.name,
+        "kind": _kind(csv_path.name),
+        "years": [int(y) for y in years],
+        "rows": len(df),
+        "columns": {col: str(dtype) for col, dtype in df.dtypes.items()},
+        "sha256": _sha256(csv_path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    if {"fund_vertical", "intent_bucket", "investor_intent_score"} <= set(df.columns):
+        entry["sectors"] = sorted(df["fund_vertical"].dropna().unique().tolist())
+        entry["buckets"] = sorted(df["intent_bucket"].dropna().unique().tolist())
+        entry["max_score"] = float(df["investor_intent_score"].max())
+    return entry
+
+
+class Catalog:
+    """Read-only view over a manifest; see :func:`open_catalog`."""
+
+    def __init__(self, base_path: Path, entries: list):
+        self.base_path = Path(base_path)
+        self.entries = entries
+
+    def states(self, kind: str = INTENT) -> list:
+        return sorted({e["state"] for e in self.entries if e["kind"] == kind})
+
+    def years(self, state: str, kind: str = INTENT) -> list:
+        return sorted({
+            y for e in self.entries
+            if e["state"] == state and e["kind"] == kind
+            for y in e["years"]
+        })
+
+    def entry(self, state: str, year: int = None, kind: str = INTENT):
+        """Manifest entry for a partition, or None. ``year`` defaults to latest."""
+        if year is None:
+            years = self.years(state, kind)
+            if not years:
+                return None
+            year = years[-1]
+        matches = [
+            e for e in self.entries
+            if e["state"] == state and e["kind"] == kind and year in e["years"]
+        ]
+        # Prefer the file dedicated to that year over multi-year exports.
+        return min(matches, key=lambda e: len(e["years"]), default=None)
+
+    def filing_set(self, state: str, year: int = None):
+        """Largest filing-level entry covering ``year``, or None. ``year`` defaults to latest.
+
+        This is the state's full filing set: the partition the views read,
+        new filings are ingested into and scoring norms are relative to.
+        Smaller files of the same kinds (such as a top-20 intent file) are
+        extracts.
+        """
+        entries = [e for e in self.entries if e["state"] == state and e["kind"] in (INTENT, FILINGS)]
+        if year is None:
+            year = max((y for e in entries for y in e["years"]), default=None)
+        matches = [e for e in entries if year in e["years"]]
+        return max(matches, key=lambda e: e["rows"], default=None)
+
+    def filing_sets(self, year: int = None) -> list:
+        """The filing set of every state for ``year`` (default: each state's latest)."""
+        states = sorted({e["state"] for e in self.entries if e["kind"] in (INTENT, FILINGS)})
+        return [e for s in states if (e := self.filing_set(s, year))]
+
+    def sectors(self, entries: list) -> list:
+        return sorted({s for e in entries for s in e.get("sectors", [])})
+
+    def prune(self, entries: list, sectors=None, buckets=None, min_score=0.0) -> list:
+        """Drop entries whose manifest stats show no row can pass the filters."""
+        kept = []
+        for e in entries:
+            if "max_score" in e and not e["max_score"] >= min_score:
+                continue
+            if sectors and "sectors" in e and not set(sectors) & set(e["sectors"]):
+                continue
+            if buckets and "buckets" in e and not set(buckets) & set(e["buckets"]):
+                continue
+            kept.append(e)
+        return kept
+
+    def path(self, entry: dict) -> Path:
+        return self.base_path / entry["path"]
+
+
+def manifest_path(base_path: Path) -> Path:
+    return Path(base_path) / MANIFEST_NAME
+
+
+def manifest_version(base_path: Path) -> int:
+    """Changes whenever the manifest is rewritten; 0 if there is none yet."""
+    try:
+        return manifest_path(base_path).stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def _write_manifest(base_path: Path, entries: list):
+    with replacing(manifest_path(base_path)) as tmp:
+        tmp.write_text(json.dumps({"version": MANIFEST_VERSION, "datasets": entries}, indent=1))
+
+
+def _read_manifest(base_path: Path):
+    try:
+        manifest = json.loads(manifest_path(base_path).read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest["datasets"]
+
+
+def refresh(base_path: Path) -> Catalog:
+    """Rescan ``base_path`` and rewrite the manifest.
+
+    Files whose size and mtime match their existing entry are not re-read.
+    """
+    base_path = Path(base_path)
+    known = {e["path"]: e for e in _read_manifest(base_path) or []}
+    entries = []
+    for folder in sorted(base_path.iterdir()):
+        if not (folder.is_dir() and STATE_PATTERN.match(folder.name)):
+            continue
+        for csv_path in sorted(folder.glob("*.csv")):
+            stat = csv_path.stat()
+            old = known.get(csv_path.relative_to(base_path).as_posix())
+            if old and (old["size"], old["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                entries.append(old)
+            else:
+                entries.append(describe(base_path, csv_path))
+    _write_manifest(base_path, entries)
+    return Catalog(base_path, entries)
+
+
+def open_catalog(base_path: Path) -> Catalog:
+    """Catalog from the manifest, scanning ``base_path`` only if it has none."""
+    entries = _read_manifest(base_path)
+    if entries is None:
+        return refresh(base_path)
+    return Catalog(base_path, entries)
+
+
+if __name__ == "__main__":
+    base = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).resolve().parent.parent / "Outputs"
+    catalog = refresh(base)
+    for e in catalog.entries:
+        print(f"{e['state']}  {e['kind']:<12} {','.join(map(str, e['years'])):<10} {e['rows']:>7}  {e['path']}")
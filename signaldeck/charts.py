@@ -0,0 +1,143 @@
+"""Figure builders for the dashboard charts.
+
+Each builder takes the already computed data for a selection (see
+:mod:`signaldeck.core`) and returns a Plotly figure. Builders read their
+input and never change it, so both apps and the batch jobs draw the same
+charts.
+"""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from signaldeck.concentration import Concentration
+from signaldeck.render import scatter
+
+BUCKET_COLORS = {
+    "🔥 Hot": "#ff6b6b",
+    "🟡 Warm": "#feca57",
+    "❄️ Cold": "#8395a7"
+}
+
+MAP_COLORS = {
+    "🔥 Hot": "#e74c3c",
+    "🟡 Warm": "#f1c40f",
+    "❄️ Cold": "#95a5a6"
+}
+
+
+def deployment(rows: pd.DataFrame) -> go.Figure:
+    """Founder view: the first 50 matching funds."""
+    return px.scatter(
+        rows.head(50),
+        x="Capital Velocity",
+        y="Recent Capital Deployed",
+        size="Investor Count",
+        color="Intent Bucket",
+        hover_name="Fund Name",
+        title="Active Funds Deployment",
+        color_discrete_map=BUCKET_COLORS,
+        template="plotly_white"
+    )
+
+
+def deployment_map(filtered: pd.DataFrame) -> go.Figure:
+    return scatter(
+        filtered,
+        x="Capital Velocity",
+        y="Recent Capital Deployed",
+        size="Investor Count",
+        color="Intent Bucket",
+        hover_name="Fund Name",
+        title="Capital Deployment Map",
+        color_discrete_map=MAP_COLORS,
+        template="plotly_white"
+    )
+
+
+def concentration(concentration: Concentration) -> go.Figure:
+    rank, cum_cap = concentration.curve()
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=rank, y=cum_cap, fill="tozeroy", name="Capital Share"))
+    fig.add_trace(go.Scatter(
+        x=rank,
+        y=rank / max(concentration.n - 1, 1),
+        line=dict(dash="dash"),
+        name="Equality Line"
+    ))
+    fig.update_layout(
+        title="Capital Concentration Curve",
+        template="plotly_white"
+    )
+    return fig
+
+
+def gp_influence(gp_df: pd.DataFrame) -> go.Figure:
+    return px.scatter(
+        gp_df,
+        x="velocity",
+        y="intent",
+        size="capital",
+        hover_name="GP Name",
+        title="GP Influence & Deployment Power",
+        template="plotly_white"
+    )
+
+
+def quadrant(filtered: pd.DataFrame) -> go.Figure:
+    fig = scatter(
+        filtered,
+        x="Days Since Filing",
+        y="Fund Momentum",
+        color="Intent Bucket",
+        hover_name="Fund Name",
+        title="Momentum vs Recency",
+        template="plotly_white",
+        color_discrete_map=BUCKET_COLORS
+    )
+    fig.add_vline(x=filtered["Days Since Filing"].median(), line_dash="dash")
+    fig.add_hline(y=filtered["Fund Momentum"].median(), line_dash="dash")
+    return fig
+
+
+def deployment_time(series: pd.Series) -> go.Figure:
+    intent_time = series.reset_index()
+
+    fig = go.Figure()
+    fig.add_bar(
+        x=intent_time["Filing Date"],
+        y=intent_time["Recent Capital Deployed"]
+    )
+    fig.update_layout(
+        title="Investor Deployment Over Time",
+        template="plotly_white"
+    )
+    return fig
+
+
+def momentum_size(filtered: pd.DataFrame) -> go.Figure:
+    return scatter(
+        filtered,
+        x="Total Fund Size",
+        y="Fund Momentum",
+        size="Investor Count",
+        color="Capital Velocity",
+        log_x=True,
+        hover_name="Fund Name",
+        title="Fund Momentum vs Fund Size",
+        dense="hexbin",
+        template="plotly_white"
+    )
+
+
+def velocity_time(top_funds: pd.DataFrame) -> go.Figure:
+    return px.scatter(
+        top_funds,
+        x="Filing Date",
+        y="Capital Velocity",
+        size="Total Fund Size",
+        color="Investor Intent Score",
+        hover_name="Fund Name",
+        title="Capital Velocity vs Time (Top Funds)",
+        template="plotly_white"
+    )
@@ -0,0 +1,249 @@
+"""Headless entry points behind the dashboard: cached loaders and per-selection results.
+
+The Streamlit apps, batch jobs and benchmarks call the same functions, so
+they all produce the same numbers. No function here touches Streamlit.
+
+Everything is cached process-wide. Per-partition structures are keyed by
+``(path, checksum)``, so replaced data never hits a stale entry. Once a
+newer catalog shows that a dataset was replaced or removed, every data cache
+is cleared, so superseded frames and indexes do not stay resident. Results
+for a selection are keyed by the partitions, the sector and bucket tuples
+and the score cut-off, in the order the sidebar uses. Row selections are
+cached as positions only; the rows themselves are taken from the shared,
+memory-mapped partitions on each call, so the caches do not grow with
+copies of the data. Cached frames must never be mutated in place.
+
+    from signaldeck import core
+    partitions = core.select_partitions(catalog, ["NY"], 2025)
+    metrics = core.load_metrics(partitions, (), ("🔥 Hot",), 0.45)
+"""
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from signaldeck import text_index
+from signaldeck.catalog import Catalog, open_catalog
+from signaldeck.concentration import Concentration
+from signaldeck.cube import AggregateCube, Metrics, merge_metrics, summarize
+from signaldeck.figure_cache import FigureCache
+from signaldeck.filter_index import FilterIndex
+from signaldeck.gp_rollup import GPRollup, merge_rollups, rollup
+from signaldeck.name_index import NameIndex, search
+from signaldeck.query import Intent, plan
+from signaldeck.ranking import RANK_COLUMNS
+from signaldeck.selection import rank_partitions, take_partitions
+from signaldeck.snapshot import load_snapshot
+from signaldeck.timeseries import deployment, deployment_from_rows, load_timeseries, rolling
+
+# Columns the views read; the snapshot store only materialises these.
+APP_COLUMNS = [
+    "Fund Name",
+    "Sector",
+    "Intent Bucket",
+    "Actively Deploying",
+    "Total Fund Size",
+    "Recent Capital Deployed",
+    "Capital Velocity",
+    "Fund Momentum",
+    "Investor Intent Score",
+    "GP Name",
+    "Investor Count",
+    "Why This Investor",
+    "Days Since Filing",
+    "Filing Date",
+]
+
+SELECTION_ENTRIES = 64
+
+# Dataset path -> checksum in the last catalog opened, per base path
+_checksums = {}
+
+
+# Keyed on the manifest's version so a rebuilt catalog is picked up
+@lru_cache(maxsize=8)
+def load_catalog(base_path: str, version: int) -> Catalog:
+    catalog = open_catalog(Path(base_path))
+    _evict_stale(base_path, catalog)
+    return catalog
+
+
+def _evict_stale(base_path: str, catalog: Catalog):
+    """Clear the data caches if a dataset seen before was replaced or removed."""
+    current = {str(catalog.path(e)): e["sha256"] for e in catalog.entries}
+    previous = _checksums.get(base_path, {})
+    _checksums[base_path] = current
+    if any(current.get(path) != checksum for path, checksum in previous.items()):
+        for cache in DATA_CACHES:
+            cache.cache_clear()
+
+
+def select_partitions(catalog: Catalog, states, year, sectors=(), buckets=(), min_score=0.0) -> tuple:
+    """``(path, checksum)`` of each state's full filing set for ``year`` that the filters can match."""
+    entries = [e for e in (catalog.filing_set(s, year) for s in states) if e is not None]
+    entries = catalog.prune(entries, sectors, buckets, min_score)
+    return tuple((str(catalog.path(e)), e["sha256"]) for e in entries)
+
+
+@lru_cache(maxsize=None)
+def load_partition(path: str, checksum: str) -> pd.DataFrame:
+    return load_snapshot(Path(path), columns=APP_COLUMNS)
+
+
+@lru_cache(maxsize=None)
+def load_filter_index(path: str, checksum: str) -> FilterIndex:
+    return FilterIndex(load_partition(path, checksum))
+
+
+@lru_cache(maxsize=None)
+def load_cube(path: str, checksum: str) -> AggregateCube:
+    return AggregateCube(load_partition(path, checksum))
+
+
+@lru_cache(maxsize=None)
+def load_gp_rollup(path: str, checksum: str) -> GPRollup:
+    return GPRollup(load_partition(path, checksum))
+
+
+@lru_cache(maxsize=None)
+def load_name_index(path: str, checksum: str) -> NameIndex:
+    return NameIndex(load_partition(path, checksum))
+
+
+@lru_cache(maxsize=None)
+def load_text_index(path: str, checksum: str) -> text_index.TextIndex:
+    return text_index.load_text_index(Path(path))
+
+
+@lru_cache(maxsize=None)
+def load_deployment_cube(path: str, checksum: str) -> pd.DataFrame:
+    return load_timeseries(Path(path))
+
+
+def _indexed(partitions):
+    return ((load_partition(p, c), load_filter_index(p, c)) for p, c in partitions)
+
+
+# Positions of each partition's rows passing the filters, per selection
+@lru_cache(maxsize=SELECTION_ENTRIES)
+def load_rows(partitions: tuple, sectors: tuple, buckets: tuple, min_score: float) -> tuple:
+    return tuple(load_filter_index(p, c).select(sectors, buckets, min_score) for p, c in partitions)
+
+
+# Filtered (and, for several states, concatenated) rows, taken afresh from
+# the cached positions
+def load_filtered(partitions: tuple, sectors: tuple, buckets: tuple, min_score: float) -> pd.DataFrame:
+    rows = load_rows(partitions, sectors, buckets, min_score)
+    return take_partitions(zip((load_partition(p, c) for p, c in partitions), rows))
+
+
+# Metrics row merged from the cubes' cells; a score cut-off between slider
+# steps falls back to the filtered rows
+@lru_cache(maxsize=SELECTION_ENTRIES)
+def load_metrics(partitions: tuple, sectors: tuple, buckets: tuple, min_score: float) -> Metrics:
+    metrics = merge_metrics((load_cube(p, c) for p, c in partitions), sectors, buckets, min_score)
+    if metrics is None:
+        metrics = summarize(load_filtered(partitions, sectors, buckets, min_score))
+    return metrics
+
+
+# GP table merged from the rollups' partials, with the same fallback
+@lru_cache(maxsize=SELECTION_ENTRIES)
+def load_gp_table(partitions: tuple, sectors: tuple, buckets: tuple, min_score: float) -> pd.DataFrame:
+    gp_df = merge_rollups((load_gp_rollup(p, c) for p, c in partitions), sectors, buckets, min_score)
+    if gp_df is None:
+        gp_df = rollup(load_filtered(partitions, sectors, buckets, min_score))
+    return gp_df
+
+
+# Capital per period summed from the time-series cubes, with the same fallback,
+# as trailing ``window``-period sums when the window is longer than one period
+@lru_cache(maxsize=SELECTION_ENTRIES)
+def load_deployment(partitions: tuple, sectors: tuple, buckets: tuple, min_score: float, period: str,
+                    window: int = 1) -> pd.Series:
+    series = deployment((load_deployment_cube(p, c) for p, c in partitions), sectors, buckets, min_score, period)
+    if series is None:
+        series = deployment_from_rows(load_filtered(partitions, sectors, buckets, min_score), period)
+    return rolling(series, window) if window > 1 else series
+
+
+# Descending row order of the filtered rows by a RANK_COLUMNS key, merged
+# from the per-partition orders precomputed in the filter index
+@lru_cache(maxsize=SELECTION_ENTRIES)
+def load_rank_order(partitions: tuple, sectors: tuple, buckets: tuple, min_score: float, column: str) -> np.ndarray:
+    return rank_partitions(_indexed(partitions), column, sectors, buckets, min_score)
+
+
+# Capital concentration of a selection, from its precomputed capital order
+@lru_cache(maxsize=SELECTION_ENTRIES)
+def load_concentration(partitions: tuple, sectors: tuple, buckets: tuple, min_score: float) -> Concentration:
+    filtered = load_filtered(partitions, sectors, buckets, min_score)
+    order = load_rank_order(partitions, sectors, buckets, min_score, "Recent Capital Deployed")
+    # An empty selection is a frame without columns
+    return Concentration(filtered["Recent Capital Deployed"].to_numpy()[order] if len(order) else [])
+
+
+# BM25 scores of the filtered rows for a query's terms, on one scale across partitions
+@lru_cache(maxsize=SELECTION_ENTRIES)
+def load_relevance(partitions: tuple, sectors: tuple, buckets: tuple, min_score: float, terms: tuple) -> np.ndarray:
+    return text_index.relevance(
+        ((load_filter_index(p, c), load_text_index(p, c)) for p, c in partitions),
+        terms, sectors, buckets, min_score
+    )
+
+
+# Positions of a query's answer in the filtered rows, per selection and
+# parsed intent, so rewordings share an entry
+@lru_cache(maxsize=256)
+def load_answer_rows(partitions: tuple, sectors: tuple, buckets: tuple, min_score: float, intent: Intent) -> np.ndarray:
+    filtered = load_filtered(partitions, sectors, buckets, min_score)
+    columns = [col for col, _ in intent.weights] + [col for col in [intent.sort] if col in RANK_COLUMNS]
+    orders = {col: load_rank_order(partitions, sectors, buckets, min_score, col) for col in columns}
+    scores = load_relevance(partitions, sectors, buckets, min_score, intent.terms) if intent.terms else None
+    return plan(filtered, intent, orders, scores)
+
+
+def load_answer(partitions: tuple, sectors: tuple, buckets: tuple, min_score: float, intent: Intent) -> pd.DataFrame:
+    return load_filtered(partitions, sectors, buckets, min_score).iloc[
+        load_answer_rows(partitions, sectors, buckets, min_score, intent)
+    ]
+
+
+# Fuzzy fund/GP name lookup across the given partitions, ignoring the filters
+@lru_cache(maxsize=256)
+def load_name_search(partitions: tuple, query: str) -> pd.DataFrame:
+    return search(((load_partition(p, c), load_name_index(p, c)) for p, c in partitions), query)
+
+
+# Top funds by intent score, for the velocity-over-time chart
+def load_top_funds(partitions: tuple, sectors: tuple, buckets: tuple, min_score: float, n: int = 20) -> pd.DataFrame:
+    filtered = load_filtered(partitions, sectors, buckets, min_score)
+    return filtered.iloc[load_rank_order(partitions, sectors, buckets, min_score, "Investor Intent Score")[:n]]
+
+
+# Built figures shared by all callers, as JSON under a 64 MB budget
+@lru_cache(maxsize=None)
+def load_figure_cache() -> FigureCache:
+    return FigureCache()
+
+
+# Everything keyed by dataset checksums, cleared by _evict_stale
+DATA_CACHES = [
+    load_partition,
+    load_filter_index,
+    load_cube,
+    load_gp_rollup,
+    load_name_index,
+    load_text_index,
+    load_deployment_cube,
+    load_rows,
+    load_metrics,
+    load_gp_table,
+    load_deployment,
+    load_rank_order,
+    load_concentration,
+    load_relevance,
+    load_answer_rows,
+    load_name_search,
+]
@@ -0,0 +1,111 @@
+"""Pre-aggregated metrics cube for the metrics row.
+
+Built once per loaded state frame. Rows are grouped into cells by sector,
+intent bucket and score bin; the bin edges follow the score slider's 0.05
+steps. Each cell holds mergeable aggregates: the active fund count, the
+capital sum, a :class:`TDigest` of intent scores and a
+:class:`HyperLogLog` of fund names. The metrics for any sidebar selection
+are then merged from the matching cells. Across partitions the sketches
+merge the same way, so shared fund names are counted once.
+"""
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from signaldeck.sketches import HyperLogLog, TDigest
+
+SCORE_STEP = 0.05
+SCORE_EDGES = np.round(np.arange(0.0, 1.0 + SCORE_STEP / 2, SCORE_STEP), 2)
+
+
+class Metrics(NamedTuple):
+    active: int
+    capital: float
+    median_score: float
+    funds: int
+
+
+def summarize(df: pd.DataFrame) -> Metrics:
+    """Metrics computed directly from rows."""
+    return Metrics(
+        int(df["Actively Deploying"].sum()),
+        float(df["Recent Capital Deployed"].sum()),
+        float(df["Investor Intent Score"].median()),
+        int(df["Fund Name"].nunique()),
+    )
+
+
+class _Partial:
+    """Aggregates of one cell, or of several merged cells."""
+
+    def __init__(self, active=0, capital=0.0, scores=None, funds=None):
+        self.active = active
+        self.capital = capital
+        self.scores = scores if scores is not None else TDigest()
+        self.funds = funds if funds is not None else HyperLogLog()
+
+    @staticmethod
+    def combine(parts: list) -> "_Partial":
+        empty = _Partial()
+        return _Partial(
+            sum(p.active for p in parts),
+            float(np.sum([p.capital for p in parts])),
+            empty.scores.merge(*(p.scores for p in parts)),
+            empty.funds.merge(*(p.funds for p in parts)),
+        )
+
+    def metrics(self) -> Metrics:
+        return Metrics(int(self.active), float(self.capital), self.scores.quantile(0.5), self.funds.count())
+
+
+def score_bin(scores: np.ndarray) -> np.ndarray:
+    # Bin k holds [SCORE_EDGES[k - 1], SCORE_EDGES[k]); bin 0 is below 0.
+    return np.searchsorted(SCORE_EDGES, scores, side="right")
+
+
+def on_grid(min_score: float) -> bool:
+    """Whether a score cut-off falls on a bin edge, so bins answer it exactly."""
+    return bool(np.any(np.abs(SCORE_EDGES - min_score) <= 1e-12))
+
+
+def first_bin(min_score: float) -> int:
+    """The lowest bin at or above an on-grid cut-off."""
+    return int(np.argmin(np.abs(SCORE_EDGES - min_score))) + 1
+
+
+class AggregateCube:
+    """Per-cell aggregates over (sector, intent bucket, score bin)."""
+
+    def __init__(self, df: pd.DataFrame):
+        rows = df[df["Investor Intent Score"].notna()]
+        bins = score_bin(rows["Investor Intent Score"].to_numpy(dtype=float))
+        self.cells = {}
+        for key, cell in rows.groupby(["Sector", "Intent Bucket", bins], dropna=False, observed=True, sort=False):
+            self.cells[key] = _Partial(
+                int(cell["Actively Deploying"].sum()),
+                float(cell["Recent Capital Deployed"].sum()),
+                TDigest(cell["Investor Intent Score"].to_numpy()),
+                HyperLogLog(cell["Fund Name"]),
+            )
+
+    def select(self, sectors=None, buckets=None, min_score=0.0) -> _Partial:
+        """Merged aggregates of the cells matching a sidebar selection.
+
+        Empty ``sectors`` / ``buckets`` mean no restriction; ``min_score``
+        must satisfy :func:`on_grid`.
+        """
+        lowest = first_bin(min_score)
+        return _Partial.combine([
+            cell for (sector, bucket, cell_bin), cell in self.cells.items()
+            if (not sectors or sector in sectors)
+            and (not buckets or bucket in buckets)
+            and cell_bin >= lowest
+        ])
+
+
+def merge_metrics(cubes, sectors=None, buckets=None, min_score=0.0):
+    """Metrics across several partitions' cubes, or None if the cut-off is off-grid."""
+    if not on_grid(min_score):
+        return None
+    return _Partial.combine([cube.select(sectors, buckets, min_score) for cube in cubes]).metrics()
@@ -0,0 +1,59 @@
+"""Process-wide cache of built Plotly figures.
+
+Figures are stored as their serialised JSON, keyed by whatever identifies
+their input: the app uses the dataset checksums, the normalised filter
+state, the view and the chart. Entries are evicted least recently used
+first once the total JSON size exceeds the byte budget. A hit skips both
+the pandas work and the Plotly Express figure construction.
+"""
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+DEFAULT_BUDGET = 64 * 1024 * 1024
+
+
+class FigureCache:
+    """LRU map from a hashable key to figure JSON, bounded in bytes."""
+
+    def __init__(self, max_bytes=DEFAULT_BUDGET):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, build) -> go.Figure:
+        """The cached figure for ``key``, calling ``build()`` on a miss."""
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if text is not None:
+            return pio.from_json(text)
+
+        figure = build()
+        text = figure.to_json()
+        with self._lock:
+            self.misses += 1
+            if len(text) <= self.max_bytes:
+                if key in self._entries:
+                    self.size -= len(self._entries.pop(key))
+                self._entries[key] = text
+                self.size += len(text)
+                while self.size > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self.size -= len(evicted)
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
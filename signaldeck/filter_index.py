@@ -0,0 +1,62 @@
+"""Precomputed row index for the sidebar filters.
+
+Built once per loaded state frame. Sector and intent bucket are stored as
+small integer codes, and rows are kept in score order so the minimum score
+slider becomes a binary search. A query then only touches the rows at or
+above the score cut-off, never the whole frame. The descending order of
+each ``RANK_COLUMNS`` key is kept too, so ranked views reuse it.
+"""
+import numpy as np
+import pandas as pd
+
+from signaldeck.ranking import RANK_COLUMNS, rank_order
+
+
+def _codes(values: pd.Series):
+    codes, uniques = pd.factorize(values)
+    return codes.astype(np.int32), list(uniques)
+
+
+def _allowed(categories: list, selected) -> np.ndarray:
+    # One flag per category plus a trailing False for missing values (code -1).
+    wanted = set(selected)
+    return np.array([c in wanted for c in categories] + [False])
+
+
+class FilterIndex:
+    """Row lookup for the sector / intent bucket / minimum score filters."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.sector_codes, self.sectors = _codes(df["Sector"])
+        self.bucket_codes, self.buckets = _codes(df["Intent Bucket"])
+
+        scores = df["Investor Intent Score"].to_numpy(dtype=float)
+        order = np.argsort(scores, kind="stable")  # NaN sorts last
+        self.score_order = order[: np.count_nonzero(~np.isnan(scores))]
+        self.sorted_scores = scores[self.score_order]
+        self.rank_orders = {c: rank_order(df[c].to_numpy()) for c in RANK_COLUMNS if c in df}
+
+    def __len__(self):
+        return len(self.sector_codes)
+
+    def select(self, sectors=None, buckets=None, min_score=0.0) -> np.ndarray:
+        """Positions of the matching rows, in original row order.
+
+        Empty ``sectors`` / ``buckets`` mean no restriction, matching the
+        sidebar multiselects.
+        """
+        start = np.searchsorted(self.sorted_scores, min_score, side="left")
+        rows = self.score_order[start:]
+        if sectors:
+            rows = rows[_allowed(self.sectors, sectors)[self.sector_codes[rows]]]
+        if buckets:
+            rows = rows[_allowed(self.buckets, buckets)[self.bucket_codes[rows]]]
+        return np.sort(rows)
+
+    def ranked(self, rows: np.ndarray, column: str) -> np.ndarray:
+        """``rows`` (from :meth:`select`) as positions into ``df.iloc[rows]``,
+        ordered by ``column`` from largest to smallest."""
+        chosen = np.zeros(len(self), dtype=bool)
+        chosen[rows] = True
+        order = self.rank_orders[column]
+        return np.searchsorted(rows, order[chosen[order]])
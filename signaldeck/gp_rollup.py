@@ -0,0 +1,70 @@
+"""Per-GP rollup behind the GP Influence chart.
+
+Built once per loaded state frame: capital sum, intent sum/count and
+velocity sum/count per GP, split by sector, intent bucket and score bin
+(the same 0.05 bins as :mod:`signaldeck.cube`). A filtered rollup is then
+a merge of the matching partials. Summing partials is exact, so the result
+equals a groupby over the filtered rows, but it works on far fewer rows.
+"""
+import numpy as np
+import pandas as pd
+
+from signaldeck.cube import first_bin, on_grid, score_bin
+
+PARTIALS = {
+    "capital": ("Recent Capital Deployed", "sum"),
+    "intent_sum": ("Investor Intent Score", "sum"),
+    "intent_count": ("Investor Intent Score", "count"),
+    "velocity_sum": ("Capital Velocity", "sum"),
+    "velocity_count": ("Capital Velocity", "count"),
+}
+
+
+def rollup(df: pd.DataFrame) -> pd.DataFrame:
+    """GP table (``GP Name``, capital, intent, velocity) straight from rows."""
+    return df.groupby("GP Name", as_index=False).agg(
+        capital=("Recent Capital Deployed", "sum"),
+        intent=("Investor Intent Score", "mean"),
+        velocity=("Capital Velocity", "mean"),
+    )
+
+
+def finalize(partials: pd.DataFrame) -> pd.DataFrame:
+    """GP table from merged partials, matching :func:`rollup`."""
+    totals = partials.groupby("GP Name", as_index=False)[list(PARTIALS)].sum()
+    return pd.DataFrame({
+        "GP Name": totals["GP Name"],
+        "capital": totals["capital"],
+        "intent": totals["intent_sum"] / totals["intent_count"].replace(0, np.nan),
+        "velocity": totals["velocity_sum"] / totals["velocity_count"].replace(0, np.nan),
+    })
+
+
+class GPRollup:
+    """GP partial aggregates per (sector, intent bucket, score bin)."""
+
+    def __init__(self, df: pd.DataFrame):
+        rows = df[df["Investor Intent Score"].notna()]
+        bins = pd.Series(score_bin(rows["Investor Intent Score"].to_numpy(dtype=float)), index=rows.index, name="score_bin")
+        self.partials = (
+            rows.groupby(["GP Name", "Sector", "Intent Bucket", bins], dropna=False, observed=True, sort=False)
+            .agg(**PARTIALS)
+            .reset_index()
+        )
+
+    def select(self, sectors=None, buckets=None, min_score=0.0) -> pd.DataFrame:
+        """Partials matching a sidebar selection; ``min_score`` must be on the grid."""
+        p = self.partials
+        mask = p["score_bin"].to_numpy() >= first_bin(min_score)
+        if sectors:
+            mask = mask & p["Sector"].isin(sectors).to_numpy()
+        if buckets:
+            mask = mask & p["Intent Bucket"].isin(buckets).to_numpy()
+        return p[mask]
+
+
+def merge_rollups(rollups, sectors=None, buckets=None, min_score=0.0):
+    """GP table across partitions, or None if the cut-off is off-grid."""
+    if not on_grid(min_score):
+        return None
+    return finalize(pd.concat([r.select(sectors, buckets, min_score) for r in rollups], ignore_index=True))
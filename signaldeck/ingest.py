@@ -0,0 +1,158 @@
+"""Incremental ingestion of new Form D filings into the state stores.
+
+New filings are routed to the full filing set of their state and filing
+year (the largest filing-level file, never an extract such as a top-20
+intent file), de-duplicated on ``accession_number`` and appended.
+Filings are aged to ``as_of`` (default: today), which may not precede the
+newest filing. While it matches the store's own reference date, per-filing
+columns are derived only for the appended rows and per-GP columns only for
+GPs that received filings. When it moves, every row is re-aged so decay
+stays consistent across the store. The state-wide normalisations
+(percentiles, min-max norms, score, bucket, explanation) are then
+refreshed with a single vectorised pass.
+
+GP centrality comes from one graph: the saved ``gp_graph.npz`` when there
+is one (extended in place, with a warm-started PageRank), otherwise the
+state's own. Stored ``gp_pagerank_norm`` values are kept. GPs that gained
+links are placed on the stored scale by matching their graph score's
+percentile among the unchanged GPs, and never drop below their old value.
+Only the touched files change, so their catalog checksums change and only
+their cache entries in the app are invalidated.
+
+    python -m signaldeck.ingest new_filings.csv
+"""
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from signaldeck.catalog import open_catalog, refresh
+from signaldeck.gp_graph import GRAPH_NAME, GPGraph
+from signaldeck.scoring import (
+    RAW_COLUMNS,
+    STORE_COLUMNS,
+    as_of_date,
+    derive_bursts,
+    derive_filings,
+    read_store,
+    rescore,
+    write_store,
+)
+from signaldeck.snapshot import build_snapshot
+from signaldeck.text_index import build_text_index
+from signaldeck.timeseries import build_timeseries
+
+
+def calibrated_pagerank(df: pd.DataFrame, graph: GPGraph, gained: set) -> pd.Series:
+    """Per-row ``gp_pagerank_norm``: the stored values, re-read from ``graph`` for ``gained`` GPs.
+
+    A gaining GP takes the stored value at the percentile its graph score
+    holds among the GPs that did not change, so new values share the
+    stored scale. The result is never below the GP's stored value.
+    """
+    names = df["related_person_name"]
+    pagerank = df["gp_pagerank_norm"] if "gp_pagerank_norm" in df else pd.Series(np.nan, index=df.index)
+    stored = pagerank.groupby(names).first()
+    graph_scores = graph.scores()["gp_pagerank_norm"]
+    gained = pd.Index(sorted(g for g in gained if g in graph_scores.index))
+
+    reference = stored.dropna()
+    reference = reference[~reference.index.isin(gained) & reference.index.isin(graph_scores.index)]
+    values = graph_scores[gained].to_numpy()
+    if len(reference):
+        ref_scores = np.sort(graph_scores[reference.index].to_numpy())
+        percentile = np.searchsorted(ref_scores, values, side="right") / len(ref_scores)
+        values = np.quantile(reference.to_numpy(), percentile)
+    values = pd.Series(np.fmax(values, stored.reindex(gained).to_numpy()), index=gained)
+
+    kept = pagerank.fillna(names.map(stored))
+    return names.map(values).where(names.isin(gained), kept).fillna(0.0)
+
+
+def merge_filings(store: pd.DataFrame, new: pd.DataFrame, as_of=None, graph: GPGraph = None) -> pd.DataFrame:
+    """``store`` with the unseen filings of ``new`` appended and rescored.
+
+    ``store`` may be None for a state/year that has no dataset yet.
+    ``as_of`` defaults to today and must not precede the newest filing.
+    ``graph`` is extended with the new filings; it defaults to the graph of
+    ``store`` alone.
+    """
+    if store is not None:
+        new = new[~new["accession_number"].isin(store["accession_number"])]
+    new = new.drop_duplicates("accession_number")
+    if new.empty:
+        return store
+
+    as_of = pd.Timestamp(as_of) if as_of is not None else pd.Timestamp.today().normalize()
+    dates = new["filing_date"] if store is None else pd.concat([store["filing_date"], new["filing_date"]])
+    if as_of < dates.max():
+        raise ValueError(f"as_of {as_of.date()} precedes the newest filing ({dates.max().date()})")
+    new = derive_filings(new[RAW_COLUMNS], as_of)
+    start = int(store["index"].max()) + 1 if store is not None else 0
+    new.insert(0, "index", range(start, start + len(new)))
+
+    if graph is None:
+        graph = GPGraph.from_filings(store) if store is not None else GPGraph()
+    gained = graph.add_filings(new)
+    df = pd.concat([store, new], ignore_index=True) if store is not None else new
+    df = df.assign(gp_pagerank_norm=calibrated_pagerank(df, graph, gained))
+    if store is not None and as_of != as_of_date(store):
+        # Re-age every row, and with it every GP's bursts
+        df = derive_bursts(derive_filings(df, as_of))
+    else:
+        df = derive_bursts(df, new["related_person_name"].unique())
+    return rescore(df)[STORE_COLUMNS]
+
+
+def _store_path(base_path: Path, catalog, state: str, year: int) -> Path:
+    entry = catalog.filing_set(state, year)
+    if entry is not None:
+        return catalog.path(entry)
+    return base_path / state / f"SEC_FORMD_{year}_VC_INVESTOR_INTENT_FINAL.csv"
+
+
+def ingest(base_path: Path, filings: pd.DataFrame, as_of=None) -> dict:
+    """Append ``filings`` to their state stores; returns rows added per file."""
+    base_path = Path(base_path)
+    catalog = open_catalog(base_path)
+    filings = filings.assign(
+        filing_date=pd.to_datetime(filings["filing_date"]),
+        date_of_first_sale=pd.to_datetime(filings["date_of_first_sale"]),
+    )
+
+    graph_path = base_path / GRAPH_NAME
+    graph = GPGraph.load(graph_path) if graph_path.exists() else None
+
+    added = {}
+    partitions = filings.groupby([filings["issuer_state"], filings["filing_date"].dt.year])
+    for (state, year), rows in partitions:
+        path = _store_path(base_path, catalog, state, int(year))
+        store = read_store(path) if path.exists() else None
+        merged = merge_filings(store, rows, as_of, graph)
+        if merged is store:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_store(merged, path)
+        build_snapshot(path)
+        build_timeseries(path)
+        build_text_index(path)
+        added[path.relative_to(base_path).as_posix()] = len(merged) - (0 if store is None else len(store))
+
+    if added:
+        if graph is not None:
+            graph.save(graph_path)
+        refresh(base_path)
+    return added
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("filings", type=Path, help="CSV of new filings")
+    parser.add_argument("--outputs", type=Path, default=Path(__file__).resolve().parent.parent / "Outputs")
+    parser.add_argument("--as-of", help="reference date filings are aged to (default: today)")
+    args = parser.parse_args()
+
+    new = pd.read_csv(args.filings, dtype={"cik": str, "accession_number": str})
+    for path, count in ingest(args.outputs, new, args.as_of).items():
+        print(f"{path}: +{count}")
@@ -0,0 +1,150 @@
+"""Trigram index for fuzzy Fund Name and GP Name lookup.
+
+Names are folded to lowercase ASCII letters and digits, with spaces and
+punctuation dropped, so "Alexander Encoded Ventures" and the raw
+``alexanderencodedventuresfundigpllc`` share their trigrams. Each distinct
+fund or GP name of a partition is one document. Its trigrams (with ``^``
+and ``$`` marking the ends) are encoded as integers in a CSR inverted
+index that is built with array operations, without looping over names.
+
+A query looks up the postings of its own trigrams and counts the shared
+trigrams per name with one ``bincount``. Names are ranked by how much of
+the query they cover, then by Jaccard similarity, so short queries find
+long names. Scores depend only on the query and the name, so searching
+several states and merging the per-state results by score gives the same
+ranking as one national index.
+"""
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+NAME_COLUMNS = {"Fund Name": "Fund", "GP Name": "GP"}
+MIN_COVERAGE = 0.5
+DEFAULT_LIMIT = 10
+
+
+def fold(names: pd.Series) -> pd.Series:
+    """Lowercase ASCII letters and digits only."""
+    return (
+        names.astype(str)
+        .str.normalize("NFKD")
+        .str.encode("ascii", "ignore")
+        .str.decode("ascii")
+        .str.lower()
+        .str.replace(r"[^a-z0-9]", "", regex=True)
+    )
+
+
+def trigrams(names: pd.Series):
+    """``(doc, code)`` pairs of the distinct trigrams of each name."""
+    padded = ("^" + fold(names) + "$").to_numpy(dtype=bytes)
+    if not len(padded):
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    width = padded.dtype.itemsize
+    chars = padded.view(np.uint8).reshape(len(padded), width).astype(np.int32)
+    codes = (chars[:, :-2] << 16) | (chars[:, 1:-1] << 8) | chars[:, 2:] if width >= 3 else chars[:, :0]
+    lengths = np.char.str_len(padded)
+    valid = np.arange(codes.shape[1]) < (lengths - 2)[:, None]
+    doc = np.broadcast_to(np.arange(len(padded))[:, None], codes.shape)[valid]
+    pairs = np.unique((doc.astype(np.int64) << 24) | codes[valid])
+    return pairs >> 24, pairs & 0xFFFFFF
+
+
+def query_trigrams(query: str) -> np.ndarray:
+    """Distinct trigram codes of one query, folded like the names."""
+    folded = unicodedata.normalize("NFKD", query).encode("ascii", "ignore").lower()
+    chars = np.frombuffer(b"^" + re.sub(rb"[^a-z0-9]", b"", folded) + b"$", dtype=np.uint8).astype(np.int64)
+    return np.unique((chars[:-2] << 16) | (chars[1:-1] << 8) | chars[2:])
+
+
+class NameIndex:
+    """Trigram postings over the distinct fund and GP names of one frame."""
+
+    def __init__(self, df: pd.DataFrame):
+        names, kinds, doc_of_row = [], [], []
+        for column, kind in NAME_COLUMNS.items():
+            codes, uniques = pd.factorize(df[column])
+            doc_of_row.append(np.where(codes >= 0, codes + len(names), -1))
+            names.extend(uniques)
+            kinds.extend([kind] * len(uniques))
+        self.names = np.array(names, dtype=object)
+        self.kinds = np.array(kinds, dtype=object)
+
+        # Rows of each document, CSR: every row appears once per name column.
+        doc_of_row = np.concatenate(doc_of_row)
+        row = np.tile(np.arange(len(df)), len(NAME_COLUMNS))[doc_of_row >= 0]
+        doc_of_row = doc_of_row[doc_of_row >= 0]
+        order = np.argsort(doc_of_row, kind="stable")
+        self.rows = row[order]
+        self.row_ptr = np.concatenate([[0], np.cumsum(np.bincount(doc_of_row, minlength=len(names)))])
+
+        doc, code = trigrams(pd.Series(self.names, dtype=object))
+        order = np.argsort(code, kind="stable")
+        self.grams, starts = np.unique(code[order], return_index=True)
+        self.gram_ptr = np.append(starts, len(order))
+        self.postings = doc[order]
+        self.sizes = np.bincount(doc, minlength=len(names))
+
+    def doc_rows(self, doc: int) -> np.ndarray:
+        return self.rows[self.row_ptr[doc]:self.row_ptr[doc + 1]]
+
+    def search(self, query: str, limit=DEFAULT_LIMIT, min_coverage=MIN_COVERAGE) -> pd.DataFrame:
+        """Best matching names: ``doc``, ``kind``, ``name``, ``coverage`` and ``jaccard``."""
+        code = query_trigrams(query)
+        slots = np.searchsorted(self.grams, code)
+        slots = slots[(slots < len(self.grams)) & (self.grams[np.minimum(slots, len(self.grams) - 1)] == code)]
+        if not len(code) or not len(slots):
+            return pd.DataFrame(columns=["doc", "kind", "name", "coverage", "jaccard"])
+
+        postings = np.concatenate([self.postings[self.gram_ptr[s]:self.gram_ptr[s + 1]] for s in slots])
+        shared = np.bincount(postings, minlength=len(self.names))
+        docs = np.flatnonzero(shared >= min_coverage * len(code))
+        coverage = shared[docs] / len(code)
+        jaccard = shared[docs] / (len(code) + self.sizes[docs] - shared[docs])
+        best = np.lexsort((-jaccard, -coverage))[:limit]
+        docs = docs[best]
+        return pd.DataFrame({
+            "doc": docs,
+            "kind": self.kinds[docs],
+            "name": self.names[docs],
+            "coverage": coverage[best],
+            "jaccard": jaccard[best],
+        })
+
+
+def search(partitions, query: str, limit=DEFAULT_LIMIT) -> pd.DataFrame:
+    """Rows of the ``limit`` best matching names across ``(frame, NameIndex)`` pairs.
+
+    Each row carries the name it matched (``Match``, ``Match Type``) and the
+    share of the query's trigrams found in it (``Match Score``).
+    """
+    partitions = list(partitions)
+    hits = []
+    for part, (_, index) in enumerate(partitions):
+        found = index.search(query, limit)
+        if len(found):
+            hits.append(found.assign(part=part))
+    if not hits:
+        return pd.DataFrame()
+    hits = pd.concat(hits, ignore_index=True).sort_values(
+        ["coverage", "jaccard", "name"], ascending=[False, False, True], kind="stable"
+    )
+    # The same GP can match in several states; keep every state's rows.
+    names = hits[["kind", "name"]].drop_duplicates().head(limit)
+    hits = hits.merge(names, on=["kind", "name"])
+
+    # One take per partition, then back into match order.
+    parts = []
+    for part, group in hits.groupby("part", sort=False):
+        df, index = partitions[part]
+        rows = [index.doc_rows(doc) for doc in group["doc"]]
+        counts = [len(r) for r in rows]
+        parts.append(df.iloc[np.concatenate(rows)].assign(**{
+            "Match": np.repeat(group["name"].to_numpy(), counts),
+            "Match Type": np.repeat(group["kind"].to_numpy(), counts),
+            "Match Score": np.repeat(group["coverage"].to_numpy(), counts),
+            "_order": np.repeat(group.index.to_numpy(), counts),
+        }))
+    return pd.concat(parts).sort_values("_order", kind="stable").drop(columns="_order").reset_index(drop=True)
@@ -0,0 +1,38 @@
+"""Canonical display names for GPs (Form D related persons).
+
+The exports spell related persons as run-together or camel-cased strings
+(``gregorypacificinvestmentmanagementcompanyllc``, ``John_Smith``). The
+string work runs once per distinct raw name, never per filing: results are
+kept in a process-wide raw -> canonical lookup table and mapped back onto
+rows through integer codes.
+"""
+import numpy as np
+import pandas as pd
+
+_CAMEL_BOUNDARY = r"([a-z])([A-Z])"
+
+# raw name -> canonical name, shared by every state loaded in this process
+_LOOKUP = {}
+
+
+def canonicalize(raw: pd.Series) -> pd.Series:
+    """Apply the display normalisation to each value of ``raw``."""
+    return (
+        raw.astype(str)
+        .str.replace(_CAMEL_BOUNDARY, r"\1 \2", regex=True)
+        .str.replace("_", " ")
+        .str.title()
+        .str.strip()
+    )
+
+
+def canonical_gp_names(raw: pd.Series) -> pd.Series:
+    """Canonical GP names for ``raw``, aligned to its index."""
+    codes, uniques = pd.factorize(raw.astype(str))
+    uniques = pd.Series(uniques)
+    missing = uniques[~uniques.isin(_LOOKUP.keys())]
+    if not missing.empty:
+        _LOOKUP.update(zip(missing, canonicalize(missing)))
+    # Missing names carry code -1, which lands on the trailing None.
+    canonical = np.append(uniques.map(_LOOKUP).to_numpy(dtype=object), None)
+    return pd.Series(canonical[codes], index=raw.index, name=raw.name, dtype="str")
@@ -0,0 +1,142 @@
+"""Query planner behind the "Ask SignalDeck" box.
+
+A query is parsed once into an ``Intent`` (sector, buckets, sort key,
+limit, blend weights, free-text terms). Intents are normalised, so
+differently worded queries asking for the same thing share one cache
+entry. ``plan`` then answers an intent in a single pass: one mask for
+sector and bucket, one sort key, and a partial top-k selection when there
+is a limit. A query without a sort keyword is ordered by the BM25
+relevance of its remaining words (see :mod:`signaldeck.text_index`).
+"""
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from signaldeck.ranking import peer_percentiles, rank_order, top_k
+from signaldeck.text_index import tokenize
+
+SECTORS = re.compile(r"(fintech|saas|ai|crypto|health|climate)")
+BUCKET_WORDS = {"hot": "🔥 Hot", "warm": "🟡 Warm", "cold": "❄️ Cold"}
+SIZE_WORDS = ("largest", "big")
+SPEED_WORDS = ("fast", "quick", "moving")
+SHORTLIST_WORDS = ("email", "this week", "reach out")
+SHORTLIST = 5
+# Words that only steer the parse; the rest are matched against the text index.
+KEYWORDS = frozenset(
+    tokenize(" ".join([SECTORS.pattern, *BUCKET_WORDS, *SIZE_WORDS, *SPEED_WORDS, *SHORTLIST_WORDS, "funds", "fund"]))
+)
+
+# "largest fast" blends size, speed and intent by percentile rank.
+BLEND = "signal_rank"
+BLEND_WEIGHTS = (
+    ("Recent Capital Deployed", 0.45),
+    ("Capital Velocity", 0.35),
+    ("Investor Intent Score", 0.20),
+)
+
+
+class Intent(NamedTuple):
+    sector: Optional[str] = None
+    buckets: tuple = ()
+    sort: Optional[str] = None
+    limit: Optional[int] = None
+    weights: tuple = ()
+    terms: tuple = ()
+
+
+@lru_cache(maxsize=1024)
+def parse(query: str, weights: tuple = BLEND_WEIGHTS) -> Intent:
+    """The intent behind a free-text query; matching is by substring.
+
+    ``weights`` are ``(column, weight)`` pairs for the blended ranking; they
+    are only kept when the query asks for it, so they never split the cache.
+    ``terms`` are the remaining words, sorted and de-duplicated, kept only
+    when no sort keyword decides the order.
+    """
+    q = query.lower()
+    match = SECTORS.search(q)
+    large = any(w in q for w in SIZE_WORDS)
+    fast = any(w in q for w in SPEED_WORDS)
+    # Later keywords override earlier ones: speed beats size, and the blend
+    # ("largest" with "fast"/"quick", not "big" or "moving") beats both.
+    if "largest" in q and ("fast" in q or "quick" in q):
+        sort = BLEND
+    elif fast:
+        sort = "Capital Velocity"
+    elif large:
+        sort = "Recent Capital Deployed"
+    else:
+        sort = None
+    return Intent(
+        sector=match.group(1) if match else None,
+        buckets=tuple(b for w, b in BUCKET_WORDS.items() if w in q),
+        sort=sort,
+        limit=SHORTLIST if any(w in q for w in SHORTLIST_WORDS) else None,
+        weights=weights if sort == BLEND else (),
+        terms=tuple(sorted(set(tokenize(q)) - KEYWORDS)) if sort is None else (),
+    )
+
+
+def _matching(values: pd.Series, predicate) -> np.ndarray:
+    """Boolean mask of ``predicate`` applied once per distinct value."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes, labels = values.cat.codes.to_numpy(), values.cat.categories
+    else:
+        codes, labels = pd.factorize(values)
+    allowed = np.fromiter((predicate(v) for v in labels), dtype=bool, count=len(labels))
+    return np.append(allowed, False)[codes]
+
+
+def _blend(df: pd.DataFrame, rows: np.ndarray, weights: tuple, orders: dict) -> np.ndarray:
+    """Weighted percentile ranks of ``rows`` among themselves."""
+    ranks = np.stack([
+        peer_percentiles(df[col].to_numpy(), orders[col] if col in orders else rank_order(df[col]), rows)
+        for col, _ in weights
+    ])
+    return np.array([w for _, w in weights]) @ ranks
+
+
+def plan(df: pd.DataFrame, intent: Intent, orders=None, relevance=None) -> np.ndarray:
+    """Row positions of ``df`` answering ``intent``, in display order.
+
+    ``orders`` maps columns to their precomputed descending row order in
+    ``df`` (see ``rank_partitions``); a sort key with an order is answered
+    by walking it, and missing ones are sorted on the spot.
+    ``relevance`` holds the BM25 score of each row of ``df`` for
+    ``intent.terms``. Matching rows come first, and the rest keep their order.
+    """
+    rows = np.arange(len(df))
+    if intent.sector:
+        rows = rows[_matching(df["Sector"], lambda s: isinstance(s, str) and intent.sector in s.lower())]
+
+    orders = orders or {}
+    key = ordered = None
+    if intent.sort == BLEND:
+        # Percentiles are taken among the sector's funds, before the
+        # bucket cut, so a bucket filter does not reshuffle the ranking.
+        key = _blend(df, rows, intent.weights, orders)
+    elif intent.sort in orders:
+        ordered = orders[intent.sort]
+    elif intent.sort:
+        key = df[intent.sort].to_numpy()[rows]
+    elif intent.terms and relevance is not None and relevance[rows].any():
+        key = relevance[rows]
+
+    for bucket in intent.buckets:
+        keep = df["Intent Bucket"].to_numpy()[rows] == bucket
+        rows = rows[keep]
+        key = key[keep] if key is not None else None
+
+    if ordered is not None:
+        # The stable order restricted to the chosen rows is their own order.
+        chosen = np.zeros(len(df), dtype=bool)
+        chosen[rows] = True
+        return ordered[chosen[ordered]][:intent.limit]
+    if key is None:
+        return rows[:intent.limit]
+    if intent.limit is None:
+        return rows[rank_order(key)]
+    return rows[top_k(key, intent.limit)]
@@ -0,0 +1,74 @@
+"""Top-N selection shared by the app's ranked tables and charts.
+
+``top_k`` finds the k largest values with ``argpartition`` and only sorts
+those, so taking the head of a ranking costs O(n + k log k) instead of a
+full sort. ``rank_order`` is the full descending order for callers that
+need every row; :class:`FilterIndex` precomputes it per state for
+``RANK_COLUMNS`` so the app never sorts a partition on rerun.
+
+Both orders are stable (ties keep row order) and put NaN last.
+
+``peer_percentiles`` turns a precomputed order into percentile ranks
+among any subset of rows in one linear pass, so ranks follow the filters
+without re-sorting.
+"""
+import numpy as np
+import pandas as pd
+
+# Sort keys the views rank by; each partition's order is precomputed.
+RANK_COLUMNS = [
+    "Investor Intent Score",
+    "Recent Capital Deployed",
+    "Capital Velocity",
+]
+
+
+def _descending_key(values) -> np.ndarray:
+    return -np.nan_to_num(np.asarray(values, dtype=float), nan=-np.inf)
+
+
+def rank_order(values) -> np.ndarray:
+    """Positions of ``values`` from largest to smallest."""
+    return np.argsort(_descending_key(values), kind="stable")
+
+
+def top_k(values, k: int) -> np.ndarray:
+    """Positions of the ``k`` largest ``values``, largest first."""
+    key = _descending_key(values)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(key):
+        # Keep every value tied with the k-th so the cut matches a full sort.
+        kth = key[np.argpartition(key, k - 1)[k - 1]]
+        rows = np.flatnonzero(key <= kth)
+        return rows[np.argsort(key[rows], kind="stable")[:k]]
+    return np.argsort(key, kind="stable")
+
+
+def nlargest(df: pd.DataFrame, column: str, k: int) -> pd.DataFrame:
+    """The ``k`` rows of ``df`` with the largest ``column``, in order."""
+    return df.iloc[top_k(df[column].to_numpy(), k)]
+
+
+def peer_percentiles(values, order: np.ndarray, peers: np.ndarray) -> np.ndarray:
+    """``values[peers].rank(pct=True)`` from the descending ``order`` of ``values``.
+
+    Ties share their average rank and NaN stays NaN, as in pandas.
+    """
+    values = np.asarray(values, dtype=float)
+    chosen = np.zeros(len(values), dtype=bool)
+    chosen[peers] = True
+    ranked = values[order]
+    member = chosen[order] & ~np.isnan(ranked)
+
+    # Tie groups along the order; each peer's ascending rank is the number
+    # of peers below its group plus the group's average position.
+    group = np.cumsum(np.r_[True, ranked[1:] != ranked[:-1]][:len(ranked)]) - 1
+    count = np.bincount(group, weights=member)
+    above = np.cumsum(count) - count
+    total = count.sum()
+    rank = (total - above - (count - 1) / 2)[group[member]]
+
+    pct = np.full(len(values), np.nan)
+    pct[order[member]] = rank / total
+    return pct[peers]
@@ -0,0 +1,94 @@
+"""Scatter rendering that stays cheap for large frames.
+
+``scatter`` is a drop-in for ``px.scatter``. Small frames go through
+unchanged. Above ``WEBGL_ROWS`` points the trace is drawn with WebGL
+(``Scattergl``). Above ``MAX_POINTS`` the points are thinned server-side
+before any Plotly JSON is built: one point is kept per cell of a grid over
+the plotted (log-)axes and per colour category. Dense regions lose only
+overplotted points, while outliers and sparse regions are kept. With
+``dense="hexbin"`` large frames are drawn as a hexagonal density map
+instead.
+"""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+WEBGL_ROWS = 1000
+MAX_POINTS = 5000
+HEXBIN_GRID = 40
+
+
+def _axis(values: pd.Series, log: bool) -> np.ndarray:
+    values = values.to_numpy(dtype=float)
+    if log:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = np.where(values > 0, np.log10(values), np.nan)
+    return values
+
+
+def _cells(values: np.ndarray, bins: int) -> np.ndarray:
+    lo, hi = np.nanmin(values), np.nanmax(values)
+    scaled = (values - lo) / (hi - lo) if hi > lo else values * 0.0
+    return np.nan_to_num(np.floor(scaled * bins), nan=-1).astype(np.int64).clip(-1, bins - 1)
+
+
+def thin(df: pd.DataFrame, x: str, y: str, max_points=MAX_POINTS, log_x=False, log_y=False, color=None) -> pd.DataFrame:
+    """At most about ``max_points`` rows of ``df`` that cover its x/y extent."""
+    if len(df) <= max_points:
+        return df
+    bins = max(int(np.sqrt(max_points)), 1)
+    key = _cells(_axis(df[x], log_x), bins) * (bins + 1) + _cells(_axis(df[y], log_y), bins)
+    if color is not None and not pd.api.types.is_numeric_dtype(df[color]):
+        key = key * (len(df) + 1) + pd.factorize(df[color])[0]
+    _, first = np.unique(key, return_index=True)
+    return df.iloc[np.sort(first)]
+
+
+def hexbin(df: pd.DataFrame, x: str, y: str, gridsize=HEXBIN_GRID, log_x=False, title=None, template=None) -> go.Figure:
+    """Point counts over a hexagonal grid, drawn as one hexagon marker per bin."""
+    px_, py_ = _axis(df[x], log_x), _axis(df[y], False)
+    ok = ~(np.isnan(px_) | np.isnan(py_))
+    px_, py_ = px_[ok], py_[ok]
+    x0, y0 = px_.min(), py_.min()
+    sx = (px_.max() - x0) / gridsize or 1.0
+    sy = (py_.max() - y0) / gridsize or 1.0
+
+    # Two offset rectangular lattices; each point goes to the nearer centre.
+    ix, iy = (px_ - x0) / sx, (py_ - y0) / sy
+    ix1, iy1 = np.round(ix), np.round(iy)
+    ix2, iy2 = np.floor(ix) + 0.5, np.floor(iy) + 0.5
+    first = (ix - ix1) ** 2 + 3 * (iy - iy1) ** 2 < (ix - ix2) ** 2 + 3 * (iy - iy2) ** 2
+    cx = np.where(first, ix1, ix2)
+    cy = np.where(first, iy1, iy2)
+    centres, counts = np.unique(np.column_stack([cx, cy]), axis=0, return_counts=True)
+
+    xs = x0 + centres[:, 0] * sx
+    fig = go.Figure(go.Scattergl(
+        x=10 ** xs if log_x else xs,
+        y=y0 + centres[:, 1] * sy,
+        mode="markers",
+        marker=dict(symbol="hexagon", size=10, color=counts, colorscale="Viridis", showscale=True,
+                    colorbar=dict(title="Funds")),
+        customdata=counts,
+        hovertemplate=f"{x}: %{{x}}<br>{y}: %{{y}}<br>Funds: %{{customdata}}<extra></extra>",
+    ))
+    fig.update_layout(title=title, template=template, xaxis_title=x, yaxis_title=y)
+    if log_x:
+        fig.update_xaxes(type="log")
+    return fig
+
+
+def scatter(df: pd.DataFrame, x: str, y: str, max_points=MAX_POINTS, dense="thin", **kwargs) -> go.Figure:
+    """``px.scatter(df, x=x, y=y, **kwargs)`` with large frames reduced first.
+
+    ``dense`` picks what happens above ``max_points``: ``"thin"`` keeps a
+    covering subset of points, ``"hexbin"`` switches to a density map.
+    """
+    if len(df) > max_points:
+        if dense == "hexbin":
+            return hexbin(df, x, y, log_x=kwargs.get("log_x", False),
+                          title=kwargs.get("title"), template=kwargs.get("template"))
+        df = thin(df, x, y, max_points, kwargs.get("log_x", False), kwargs.get("log_y", False), kwargs.get("color"))
+    render_mode = "webgl" if len(df) > WEBGL_ROWS else "svg"
+    return px.scatter(df, x=x, y=y, render_mode=render_mode, **kwargs)
@@ -0,0 +1,144 @@
+"""Batch renderer for the static chart set in ``Outputs/<STATE>/``.
+
+Every dashboard chart is rebuilt for each state from the
+:mod:`signaldeck.charts` builders and the :mod:`signaldeck.core` loaders,
+so the PNGs match what the app shows for the same selection (by default
+the sidebar defaults). States are rendered in a process pool.
+
+A chart is skipped when the key of its inputs matches the one recorded in
+``<STATE>/charts.json``. The key covers the dataset checksum, the
+selection, the image size and the source of the chart builders. Charts
+are re-rendered when the data, the filters or a figure definition change.
+
+PNG export needs kaleido (``pip install -r requirements-dev.txt``).
+
+    python -m signaldeck.reports [--force] [--workers N]
+"""
+import argparse
+import hashlib
+import importlib.util
+import inspect
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from signaldeck import charts, render
+from signaldeck.atomic import replacing
+from signaldeck.catalog import open_catalog
+from signaldeck.core import (
+    load_concentration,
+    load_deployment,
+    load_filtered,
+    load_gp_table,
+    load_top_funds,
+    select_partitions,
+)
+
+MANIFEST_NAME = "charts.json"
+DEFAULT_BUCKETS = ("🔥 Hot", "🟡 Warm")
+DEFAULT_MIN_SCORE = 0.45
+DEPLOYMENT_PERIOD = "MS"
+
+# file name -> (builder over a selection, width, height); rendered at scale 2
+CHARTS = {
+    "Plot_active_funds_deployment.png": (lambda s: charts.deployment(load_filtered(*s)), 1320, 660),
+    "Plot_capital_deployment_map.png": (lambda s: charts.deployment_map(load_filtered(*s)), 1320, 660),
+    "Capital_Concentration_Curve.png": (lambda s: charts.concentration(load_concentration(*s)), 800, 500),
+    "Plot_GP_Influence_Bubble.png": (lambda s: charts.gp_influence(load_gp_table(*s)), 1100, 770),
+    "Plot_momentum_recency_quadrant.png": (lambda s: charts.quadrant(load_filtered(*s)), 1320, 660),
+    "Investor_intent_over_time.png": (
+        lambda s: charts.deployment_time(load_deployment(*s, DEPLOYMENT_PERIOD)), 1320, 660
+    ),
+    "Plot_top_fund_momentum_vs_size.png": (lambda s: charts.momentum_size(load_filtered(*s)), 1320, 660),
+    "Plot_Capital_Velocity_vs_Time.png": (lambda s: charts.velocity_time(load_top_funds(*s)), 1320, 660),
+}
+
+
+def definitions_digest() -> str:
+    """Hash of the chart builder source, so edited figures are re-rendered."""
+    source = inspect.getsource(charts) + inspect.getsource(render)
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def input_key(name: str, checksum: str, buckets, min_score, digest: str) -> str:
+    _, width, height = CHARTS[name]
+    payload = [name, checksum, sorted(buckets), min_score, DEPLOYMENT_PERIOD, width, height, digest]
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode()).hexdigest()
+
+
+def _read_manifest(folder: Path) -> dict:
+    try:
+        return json.loads((folder / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def render_state(base_path: Path, state: str, year, buckets, min_score, force=False) -> dict:
+    """Render one state's charts; ``{file name: "rendered" | "unchanged" | "empty" | error}``."""
+    catalog = open_catalog(base_path)
+    folder = Path(base_path) / state
+    partitions = select_partitions(catalog, [state], year, (), buckets, min_score)
+    selection = (partitions, (), tuple(buckets), min_score)
+    checksum = partitions[0][1] if partitions else None
+    digest = definitions_digest()
+
+    manifest = _read_manifest(folder)
+    status = {}
+    for name, (build, width, height) in CHARTS.items():
+        key = input_key(name, checksum, buckets, min_score, digest)
+        if not force and manifest.get(name) == key and (folder / name).exists():
+            status[name] = "unchanged"
+            continue
+        if checksum is None or load_filtered(*selection).empty:
+            status[name] = "empty"
+            continue
+        try:
+            with replacing(folder / name) as tmp:
+                build(selection).write_image(str(tmp), format="png", width=width, height=height, scale=2)
+        except (ValueError, RuntimeError) as exc:
+            status[name] = f"failed: {exc}"
+            continue
+        manifest[name] = key
+        status[name] = "rendered"
+
+    with replacing(folder / MANIFEST_NAME) as tmp:
+        tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    return status
+
+
+def render_all(base_path: Path, states, year=None, buckets=DEFAULT_BUCKETS, min_score=DEFAULT_MIN_SCORE,
+               force=False, workers=None) -> dict:
+    """``{state: render_state(...)}``, one process per state."""
+    states = list(states)
+    n = len(states)
+    args = ([base_path] * n, states, [year] * n, [tuple(buckets)] * n, [min_score] * n, [force] * n)
+    if workers == 1 or n < 2:
+        return dict(zip(states, map(render_state, *args)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(states, pool.map(render_state, *args)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--outputs", type=Path, default=Path(__file__).resolve().parent.parent / "Outputs")
+    parser.add_argument("--states", nargs="+", help="default: every state in the catalog")
+    parser.add_argument("--year", type=int, help="default: each state's latest")
+    parser.add_argument("--buckets", nargs="*", default=list(DEFAULT_BUCKETS))
+    parser.add_argument("--min-score", type=float, default=DEFAULT_MIN_SCORE)
+    parser.add_argument("--force", action="store_true", help="re-render unchanged charts too")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if importlib.util.find_spec("kaleido") is None:
+        sys.exit("PNG export needs kaleido: pip install -r requirements-dev.txt")
+    states = args.states or open_catalog(args.outputs).states()
+    results = render_all(args.outputs, states, args.year, args.buckets, args.min_score, args.force, args.workers)
+    for state, status in results.items():
+        counts = {}
+        for outcome in status.values():
+            counts[outcome.split(":")[0]] = counts.get(outcome.split(":")[0], 0) + 1
+        print(f"{state}: " + ", ".join(f"{v} {k}" for k, v in sorted(counts.items())))
+        for name, outcome in status.items():
+            if outcome.startswith("failed"):
+                print(f"  {name}: {outcome}")
@@ -0,0 +1,286 @@
+"""Scoring engine that regenerates the derived Form D columns.
+
+From the raw filing columns (``RAW_COLUMNS``) plus the GP graph scores
+(see ``signaldeck.gp_graph``) it rebuilds everything else in the intent
+exports:
+time decay, velocity, acceleration, momentum, the GP burst ratio, the
+state-wide percentiles and norms, ``investor_intent_score``,
+``intent_bucket`` and the ``why_investor`` text. All steps are vectorised
+pandas/NumPy; states are scored independently, so a full rescore fans out
+across processes.
+
+    python -m signaldeck.scoring            # rescore every state in place
+    python -m signaldeck.scoring --check    # report drift, write nothing
+    python -m signaldeck.scoring --graph national
+"""
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from signaldeck.atomic import replacing
+from signaldeck.gp_graph import GPGraph
+
+# Columns a filing must carry; everything else in a store is derived.
+RAW_COLUMNS = [
+    "cik",
+    "filing_date",
+    "issuer_name",
+    "issuer_state",
+    "issuer_industry_group",
+    "offering_amount_total",
+    "total_amount_sold",
+    "number_of_investors",
+    "date_of_first_sale",
+    "accession_number",
+    "fund_vertical",
+    "related_person_name",
+]
+
+# Column order of the intent exports.
+STORE_COLUMNS = ["index"] + RAW_COLUMNS + [
+    "days_since_filing",
+    "days_to_first_sale",
+    "time_decay_weight",
+    "decayed_amount_sold",
+    "decayed_amount_percentile",
+    "sale_velocity",
+    "sale_acceleration",
+    "fund_momentum",
+    "gp_degree_norm",
+    "gp_pagerank_norm",
+    "velocity_norm",
+    "acceleration_norm",
+    "momentum_norm",
+    "investor_intent_score",
+    "actively_deploying",
+    "sector_intent_score",
+    "recent_burst_ratio",
+    "recent_burst_flag",
+    "intent_bucket",
+    "why_investor",
+]
+
+DECAY_MIDPOINT_DAYS = 90
+DECAY_RATE = 0.05
+BURST_WINDOW = "30D"
+BURST_BASELINE = "180D"
+
+SCORE_WEIGHTS = {
+    "decayed_amount_percentile": 0.32,
+    "velocity_norm": 0.18,
+    "acceleration_norm": 0.12,
+    "momentum_norm": 0.10,
+    "gp_degree_norm": 0.16,
+    "gp_pagerank_norm": 0.12,
+}
+ACTIVE_SCORE = 0.55
+HOT_SCORE = 0.6
+WARM_SCORE = 0.5
+
+
+def read_store(path: Path) -> pd.DataFrame:
+    return pd.read_csv(
+        path,
+        dtype={"cik": str, "accession_number": str},
+        parse_dates=["filing_date", "date_of_first_sale"],
+    )
+
+
+def write_store(df: pd.DataFrame, path: Path):
+    with replacing(path) as tmp:
+        df.to_csv(tmp, index=False)
+
+
+def as_of_date(store: pd.DataFrame) -> pd.Timestamp:
+    """The reference date the store's ``days_since_filing`` was computed at."""
+    return (store["filing_date"] + pd.to_timedelta(store["days_since_filing"], unit="D")).max()
+
+
+def _minmax(values: pd.Series) -> pd.Series:
+    span = values.max() - values.min() if len(values) else 0.0
+    return (values - values.min()) / span if span > 0 else values * 0.0
+
+
+def derive_filings(rows: pd.DataFrame, as_of: pd.Timestamp) -> pd.DataFrame:
+    """Columns that depend only on the filing itself."""
+    days = (as_of - rows["filing_date"]).dt.days
+    sold = rows["total_amount_sold"].astype(float)
+    weight = 1.0 / (1.0 + np.exp(DECAY_RATE * (days - DECAY_MIDPOINT_DAYS)))
+    velocity = sold / days.clip(lower=1)
+    return rows.assign(
+        days_since_filing=days,
+        days_to_first_sale=days.astype(float),
+        time_decay_weight=weight,
+        decayed_amount_sold=sold * weight,
+        sale_velocity=velocity,
+        sale_acceleration=velocity / days.clip(lower=1),
+        fund_momentum=np.log1p(velocity * sold * weight),
+    )
+
+
+def derive_bursts(df: pd.DataFrame, gps=None) -> pd.DataFrame:
+    """Burst ratio for every filing of ``gps`` (default: all GPs).
+
+    The ratio is the GP's decayed capital over the trailing 30 days divided
+    by its trailing 180 days, evaluated at each filing.
+    """
+    rows = df if gps is None else df[df["related_person_name"].isin(gps)]
+    rows = rows.sort_values(["related_person_name", "filing_date", "index"])
+    amounts = rows.set_index("filing_date").groupby("related_person_name", sort=False)["decayed_amount_sold"]
+    recent = amounts.rolling(BURST_WINDOW).sum().to_numpy()
+    baseline = amounts.rolling(BURST_BASELINE).sum().to_numpy()
+    ratio = pd.Series(recent / (baseline + 1e-6), index=rows.index)
+    df = df.copy()
+    df.loc[ratio.index, "recent_burst_ratio"] = ratio
+    df.loc[ratio.index, "recent_burst_flag"] = (ratio >= 0.5).astype(int)
+    return df.astype({"recent_burst_flag": int})
+
+
+def explain(df: pd.DataFrame) -> pd.Series:
+    """The ``why_investor`` text: up to three reasons, in rule order."""
+    reasons = [
+        (df["decayed_amount_percentile"].to_numpy() > 0.8,
+         ("Deployed $" + df["decayed_amount_sold"].map("{:.0f}".format) + " recently").to_numpy(dtype=object)),
+        (df["velocity_norm"].to_numpy() >= 0.7, "Top 30% in deployment velocity"),
+        (df["gp_pagerank_norm"].to_numpy() >= 0.7, "Highly central in VC syndicates"),
+        (df["sector_intent_score"].to_numpy() > 0.8, "Hot in this sector"),
+    ]
+    why = np.full(len(df), "", dtype=object)
+    count = np.zeros(len(df), dtype=int)
+    for mask, text in reasons:
+        mask = mask & (count < 3)
+        why = np.where(mask, np.where(count > 0, why + ", ", why) + text, why)
+        count += mask
+    return pd.Series(why, index=df.index, dtype="str").replace("", np.nan)
+
+
+def rescore(df: pd.DataFrame, gp_scores: pd.DataFrame = None) -> pd.DataFrame:
+    """State-wide normalisations, score, bucket and explanation.
+
+    ``gp_scores`` (``GPGraph.scores()``) supplies both GP graph columns;
+    without it degree comes from ``df`` and ``gp_pagerank_norm`` is kept.
+    """
+    if gp_scores is None:
+        degree = np.log1p(df.groupby("related_person_name")["issuer_name"].transform("nunique"))
+        gp = {"gp_degree_norm": _minmax(degree)}
+    else:
+        names = df["related_person_name"]
+        gp = {col: names.map(gp_scores[col]).fillna(0.0) for col in ("gp_degree_norm", "gp_pagerank_norm")}
+    df = df.assign(
+        decayed_amount_percentile=df["decayed_amount_sold"].rank(pct=True),
+        **gp,
+        velocity_norm=_minmax(df["sale_velocity"]),
+        acceleration_norm=_minmax(df["sale_acceleration"]),
+        momentum_norm=_minmax(df["fund_momentum"]),
+    )
+    score = sum(df[col] * weight for col, weight in SCORE_WEIGHTS.items())
+    df = df.assign(
+        investor_intent_score=score,
+        actively_deploying=(score >= ACTIVE_SCORE).astype(int),
+        sector_intent_score=score.rank(pct=True),
+        intent_bucket=np.select(
+            [score >= HOT_SCORE, score >= WARM_SCORE], ["🔥 Hot", "🟡 Warm"], "❄️ Cold"
+        ),
+    )
+    return df.assign(why_investor=explain(df))
+
+
+def score_filings(raw: pd.DataFrame, as_of=None, gp_scores: pd.DataFrame = None) -> pd.DataFrame:
+    """Rebuild every derived column of one state's filings.
+
+    ``raw`` needs ``RAW_COLUMNS``. GP graph columns come from ``gp_scores``
+    if given; otherwise an existing ``gp_pagerank_norm`` is kept, and input
+    without one is scored on its own GP graph. ``as_of`` defaults to the
+    date the input was last scored at, or today for unscored input.
+    """
+    if as_of is None:
+        as_of = as_of_date(raw) if "days_since_filing" in raw else pd.Timestamp.today().normalize()
+    if gp_scores is None and "gp_pagerank_norm" not in raw:
+        gp_scores = GPGraph.from_filings(raw).scores()
+    df = raw[RAW_COLUMNS].assign(
+        index=raw["index"] if "index" in raw else np.arange(len(raw)),
+        gp_pagerank_norm=raw["gp_pagerank_norm"] if gp_scores is None else 0.0,
+    )
+    df = derive_filings(df, pd.Timestamp(as_of))
+    df = derive_bursts(df)
+    return rescore(df, gp_scores)[STORE_COLUMNS]
+
+
+def _score_file(path: Path, as_of, check: bool, graph: str = "keep") -> dict:
+    started = time.perf_counter()
+    store = read_store(path)
+    if isinstance(graph, pd.DataFrame):
+        gp_scores = graph
+    elif graph == "state":
+        gp_scores = GPGraph.from_filings(store).scores()
+    else:
+        gp_scores = None
+    scored = score_filings(store, as_of, gp_scores)
+    elapsed = time.perf_counter() - started
+
+    numeric = [c for c in STORE_COLUMNS if c in store and scored[c].dtype.kind in "fi"]
+    drift = (scored[numeric] - store[numeric]).abs().max().max() if len(store) else 0.0
+    if not check:
+        write_store(scored, path)
+    return {"path": path, "rows": len(scored), "seconds": elapsed, "drift": drift}
+
+
+def score_paths(paths, as_of=None, check=False, workers=None, graph="keep") -> list:
+    """Rescore store files in parallel, one process per file.
+
+    ``graph`` picks the GP graph columns: ``"keep"`` the stored ones,
+    ``"state"`` each file's own graph, or a ``GPGraph.scores()`` frame
+    shared by every file (e.g. the national graph).
+    """
+    paths = list(paths)
+    n = len(paths)
+    if workers == 1 or n < 2:
+        return [_score_file(p, as_of, check, graph) for p in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_score_file, paths, [as_of] * n, [check] * n, [graph] * n))
+
+
+if __name__ == "__main__":
+    from signaldeck.catalog import open_catalog, refresh
+    from signaldeck.snapshot import build_snapshot
+    from signaldeck.text_index import build_text_index
+    from signaldeck.timeseries import build_timeseries
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--outputs", type=Path, default=Path(__file__).resolve().parent.parent / "Outputs")
+    parser.add_argument("--as-of", help="reference date (default: each file's current one)")
+    parser.add_argument("--check", action="store_true", help="report drift without writing")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--graph", choices=["keep", "state", "national"], default="keep",
+        help="GP graph columns: keep the stored ones, or recompute per state or nationally",
+    )
+    args = parser.parse_args()
+
+    # Norms are relative to a state's full filing set, so only the filing
+    # set of each state/year is rescored; extracts such as a top-20 intent
+    # file are left alone.
+    catalog = open_catalog(args.outputs)
+    years = sorted({y for e in catalog.entries for y in e["years"]})
+    full = {e["path"]: e for y in years for e in catalog.filing_sets(y)}
+    paths = [catalog.path(e) for e in full.values()]
+    graph = args.graph
+    if graph == "national":
+        from signaldeck.gp_graph import national_graph
+
+        graph = national_graph(args.outputs).scores()
+    for result in score_paths(paths, args.as_of, args.check, args.workers, graph):
+        print(
+            f"{result['path'].relative_to(args.outputs)}: {result['rows']} rows "
+            f"in {result['seconds'] * 1000:.0f} ms, max drift {result['drift']:.2e}"
+        )
+        if not args.check:
+            build_snapshot(result["path"])
+            build_timeseries(result["path"])
+            build_text_index(result["path"])
+    if not args.check:
+        refresh(args.outputs)
@@ -0,0 +1,44 @@
+"""Sidebar filtering over one or more state partitions.
+
+Filters are pushed down into each partition's :class:`FilterIndex` so only
+matching rows are taken before the partitions are concatenated.
+"""
+import numpy as np
+import pandas as pd
+
+from signaldeck.ranking import rank_order
+
+
+def take_partitions(parts) -> pd.DataFrame:
+    """Concatenate ``frame.iloc[rows]`` over ``(frame, rows)`` pairs."""
+    parts = [df.iloc[rows] for df, rows in parts if len(rows)]
+    if not parts:
+        return pd.DataFrame()
+    if len(parts) == 1:
+        return parts[0]
+    return pd.concat(parts, ignore_index=True)
+
+
+def filter_partitions(partitions, sectors=None, buckets=None, min_score=0.0) -> pd.DataFrame:
+    """Concatenate the filtered rows of each ``(frame, FilterIndex)`` pair."""
+    return take_partitions((df, index.select(sectors, buckets, min_score)) for df, index in partitions)
+
+
+def rank_partitions(partitions, column, sectors=None, buckets=None, min_score=0.0) -> np.ndarray:
+    """Positions into ``filter_partitions(...)`` ordered by ``column``, largest first.
+
+    Each partition contributes its precomputed order; several partitions
+    are merged with a stable sort, which runs in near-linear time on the
+    already sorted runs.
+    """
+    runs, values, offset = [], [], 0
+    for df, index in partitions:
+        rows = index.select(sectors, buckets, min_score)
+        if len(rows):
+            runs.append(index.ranked(rows, column) + offset)
+            values.append(df[column].to_numpy()[rows])
+            offset += len(rows)
+    if len(runs) <= 1:
+        return runs[0] if runs else np.empty(0, dtype=np.intp)
+    order = np.concatenate(runs)
+    return order[rank_order(np.concatenate(values)[order])]
@@ -0,0 +1,126 @@
+"""Mergeable summaries: a t-digest for quantiles and HyperLogLog for distinct counts.
+
+Both keep their input exactly while it is small (``EXACT_LIMIT`` values
+or hashes), the way HyperLogLog++ keeps a sparse list before switching to
+registers. Quantiles and counts are therefore exact for state-sized data
+and only become approximate once a summary has outgrown the buffer.
+Merging never needs the underlying rows.
+"""
+import numpy as np
+import pandas as pd
+
+EXACT_LIMIT = 4096
+COMPRESSION = 200
+HLL_PRECISION = 12
+
+
+class TDigest:
+    """Quantile sketch: exact values until ``EXACT_LIMIT``, then centroids."""
+
+    def __init__(self, values=(), compression=COMPRESSION):
+        self.compression = compression
+        values = np.asarray(values, dtype=float)
+        self.means = np.sort(values[~np.isnan(values)])
+        self.weights = None  # None while every centroid is a single value
+        self._maybe_compress()
+
+    @property
+    def count(self) -> float:
+        return len(self.means) if self.weights is None else float(self.weights.sum())
+
+    def _maybe_compress(self):
+        if self.weights is None and len(self.means) <= EXACT_LIMIT:
+            return
+        weights = np.ones(len(self.means)) if self.weights is None else self.weights
+        order = np.argsort(self.means, kind="stable")
+        means, weights = self.means[order], weights[order]
+
+        # Centroids whose mid-quantile falls in the same unit of the k1
+        # scale function are merged, so the tails stay finely resolved.
+        total = weights.sum()
+        q = (np.cumsum(weights) - weights / 2) / total
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q - 1)
+        group = np.unique(np.floor(k), return_inverse=True)[1]
+        merged = np.bincount(group, weights=weights)
+        self.means = np.bincount(group, weights=means * weights) / merged
+        self.weights = merged
+
+    def merge(self, *others: "TDigest") -> "TDigest":
+        digests = (self,) + others
+        out = TDigest(compression=self.compression)
+        out.means = np.concatenate([d.means for d in digests])
+        if all(d.weights is None for d in digests):
+            out.means.sort()
+        else:
+            out.weights = np.concatenate([
+                np.ones(len(d.means)) if d.weights is None else d.weights for d in digests
+            ])
+        out._maybe_compress()
+        return out
+
+    def quantile(self, q: float) -> float:
+        if len(self.means) == 0:
+            return np.nan
+        if self.weights is None:
+            return float(np.quantile(self.means, q))
+        centres = np.cumsum(self.weights) - self.weights / 2
+        return float(np.interp(q * self.weights.sum(), centres, self.means))
+
+
+def _hashes(values) -> np.ndarray:
+    values = pd.Series(values).dropna()
+    return np.unique(pd.util.hash_array(values.to_numpy(dtype=object)))
+
+
+def _leading_zeros(words: np.ndarray) -> np.ndarray:
+    # Exact for 64-bit words: take log2 of each 32-bit half separately.
+    hi = (words >> np.uint64(32)).astype(np.float64)
+    lo = (words & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    with np.errstate(divide="ignore"):
+        return np.where(
+            hi > 0,
+            31 - np.floor(np.log2(hi)),
+            np.where(lo > 0, 63 - np.floor(np.log2(lo)), 64),
+        ).astype(np.int64)
+
+
+class HyperLogLog:
+    """Distinct counter: an exact hash set until ``EXACT_LIMIT``, then registers."""
+
+    def __init__(self, values=(), precision=HLL_PRECISION):
+        self.precision = precision
+        self.hashes = _hashes(values)
+        self.registers = None
+        self._maybe_densify()
+
+    def _maybe_densify(self):
+        if self.registers is None and len(self.hashes) <= EXACT_LIMIT:
+            return
+        p = self.precision
+        registers = np.zeros(1 << p, dtype=np.uint8) if self.registers is None else self.registers
+        if len(self.hashes):
+            index = (self.hashes >> np.uint64(64 - p)).astype(np.int64)
+            rank = np.minimum(_leading_zeros(self.hashes << np.uint64(p)) + 1, 64 - p + 1)
+            np.maximum.at(registers, index, rank.astype(np.uint8))
+        self.registers = registers
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+    def merge(self, *others: "HyperLogLog") -> "HyperLogLog":
+        counters = (self,) + others
+        out = HyperLogLog(precision=self.precision)
+        out.hashes = np.unique(np.concatenate([c.hashes for c in counters]))
+        registers = [c.registers for c in counters if c.registers is not None]
+        if registers:
+            out.registers = np.maximum.reduce(registers)
+        out._maybe_densify()
+        return out
+
+    def count(self) -> int:
+        if self.registers is None:
+            return len(self.hashes)
+        m = len(self.registers)
+        estimate = 0.7213 / (1 + 1.079 / m) * m * m / np.sum(2.0 ** -self.registers.astype(float))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)  # linear counting for small ranges
+        return int(round(estimate))
@@ -0,0 +1,144 @@
+"""Columnar snapshots of the per-state Form D exports.
+
+Each CSV under ``Outputs/<STATE>/`` is compiled once into an Arrow IPC
+(Feather v2) file next to it, with the display column names and dtypes
+already applied. Loading a snapshot skips CSV parsing entirely and only
+materialises the columns that are asked for.
+
+Snapshots are uncompressed and memory-mapped, so the returned frames are
+read-only views over the OS page cache: every session and every server
+process on a host shares one physical copy of each state. This relies on
+pandas 3, whose string columns stay Arrow-backed; pandas 2 would turn them
+into per-process Python objects. Callers must treat loaded frames as
+immutable and derive new ones (masks, ``assign``) instead.
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from signaldeck.atomic import replacing
+from signaldeck.names import canonical_gp_names
+
+SNAPSHOT_VERSION = 2
+SNAPSHOT_SUFFIX = ".arrow"
+STAMP_KEY = b"signaldeck.source"
+
+COLUMN_RENAMES = {
+    "issuer_name": "Fund Name",
+    "issuer_state": "State",
+    "fund_vertical": "Sector",
+    "intent_bucket": "Intent Bucket",
+    "actively_deploying": "Actively Deploying",
+    "offering_amount_total": "Total Fund Size",
+    "total_amount_sold": "Lifetime Capital Deployed",
+    "decayed_amount_sold": "Recent Capital Deployed",
+    "sale_velocity": "Capital Velocity",
+    "sale_acceleration": "Capital Acceleration",
+    "fund_momentum": "Fund Momentum",
+    "investor_intent_score": "Investor Intent Score",
+    "related_person_name": "GP Name",
+    "number_of_investors": "Investor Count",
+    "why_investor": "Why This Investor",
+    "days_since_filing": "Days Since Filing",
+    "filing_date": "Filing Date",
+}
+
+DATE_COLUMNS = ["filing_date", "date_of_first_sale"]
+TEXT_COLUMNS = ["cik", "accession_number"]
+CATEGORY_COLUMNS = ["State", "Sector", "Intent Bucket"]
+
+
+def read_source_csv(path: Path) -> pd.DataFrame:
+    """Parse an export CSV and apply the app's column names, dtypes and GP names."""
+    header = pd.read_csv(path, nrows=0).columns
+    df = pd.read_csv(
+        path,
+        parse_dates=[c for c in DATE_COLUMNS if c in header],
+        dtype={c: str for c in TEXT_COLUMNS if c in header},
+    )
+    df = df.rename(columns=COLUMN_RENAMES)
+    if "GP Name" in df:
+        df.insert(df.columns.get_loc("GP Name") + 1, "GP Raw Name", df["GP Name"])
+        df["GP Name"] = canonical_gp_names(df["GP Raw Name"])
+    for col in CATEGORY_COLUMNS:
+        if col in df:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def snapshot_path(csv_path: Path) -> Path:
+    return Path(csv_path).with_suffix(SNAPSHOT_SUFFIX)
+
+
+def source_stamp(csv_path: Path) -> bytes:
+    stat = Path(csv_path).stat()
+    return f"{SNAPSHOT_VERSION}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+
+
+def is_fresh(csv_path: Path) -> bool:
+    """True when the snapshot exists and was built from the current CSV."""
+    path = snapshot_path(csv_path)
+    if not path.exists():
+        return False
+    try:
+        with pa.memory_map(str(path)) as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return False
+    return metadata.get(STAMP_KEY) == source_stamp(csv_path)
+
+
+def build_snapshot(csv_path: Path) -> Path:
+    """Compile one CSV into its snapshot file and return the snapshot path."""
+    csv_path = Path(csv_path)
+    table = pa.Table.from_pandas(read_source_csv(csv_path), preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[STAMP_KEY] = source_stamp(csv_path)
+    table = table.replace_schema_metadata(metadata)
+
+    out = snapshot_path(csv_path)
+    # Atomic swap: processes still mapping the old file keep a valid view.
+    with replacing(out) as tmp:
+        feather.write_feather(table, str(tmp), compression="uncompressed")
+    return out
+
+
+def load_snapshot(csv_path: Path, columns=None) -> pd.DataFrame:
+    """Load ``columns`` (default: all) for a CSV, rebuilding a stale snapshot.
+
+    If the snapshot cannot be written (e.g. a read-only deploy), the CSV is
+    parsed directly so the app keeps working.
+    """
+    if not is_fresh(csv_path):
+        try:
+            build_snapshot(csv_path)
+        except OSError:
+            df = read_source_csv(csv_path)
+            return df if columns is None else df[list(columns)]
+    # Read the whole mapped file and select afterwards: the IPC reader hands
+    # out views of the mapping, whereas a column-projected feather read
+    # copies the record batches into Arrow's memory pool.
+    table = pa.ipc.open_file(pa.memory_map(str(snapshot_path(csv_path)))).read_all()
+    if columns is not None:
+        table = table.select(list(columns))
+    # split_blocks keeps each column backed by its own mapped Arrow buffer
+    # instead of consolidating (and copying) same-dtype columns together.
+    return table.to_pandas(split_blocks=True)
+
+
+def build_all(base_path: Path) -> list:
+    """Snapshot every CSV in every state folder under ``base_path``."""
+    built = []
+    for csv_path in sorted(Path(base_path).glob("*/*.csv")):
+        if not is_fresh(csv_path):
+            built.append(build_snapshot(csv_path))
+    return built
+
+
+if __name__ == "__main__":
+    base = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).resolve().parent.parent / "Outputs"
+    for path in build_all(base):
+        print(f"built {path.relative_to(base)}")
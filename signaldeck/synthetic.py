@@ -0,0 +1,156 @@
+"""Synthetic Form D state partitions for scale and load testing.
+
+A :class:`Profile` is fitted to the shipped intent exports. It keeps the
+sector and industry mix, the joint (offering, sold) amounts in log space,
+investor counts, the lag to first sale, how many filings each fund makes,
+how many funds each GP runs, and filing-date seasonality (by month and by
+weekday). :func:`generate` samples the raw filing columns from the profile.
+Amounts are resampled with kernel jitter, so the heavy tails survive
+without repeating exact values. The scoring engine then derives every
+other column, so a partition has exactly the intent-export layout, its
+own GP graph and intent buckets.
+
+    python -m signaldeck.synthetic --rows 1000000 --states CA NY --out Synthetic
+
+The output directory is laid out like ``Outputs/``, with snapshots, a
+time-series cube and a catalog, so the app can be pointed at it through
+``SIGNALDECK_OUTPUTS``.
+"""
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from signaldeck.scoring import RAW_COLUMNS, as_of_date, read_store, score_filings, write_store
+
+INTENT_FILE = "SEC_FORMD_{year}_VC_INVESTOR_INTENT_FINAL.csv"
+
+
+def _bandwidth(values: np.ndarray) -> float:
+    # Silverman's rule of thumb for a Gaussian kernel.
+    return 1.06 * float(np.std(values)) * len(values) ** -0.2
+
+
+class Profile:
+    """Column distributions of the intent exports in ``stores``."""
+
+    def __init__(self, stores):
+        df = pd.concat(stores, ignore_index=True)
+        self.year = int(df["filing_date"].dt.year.mode()[0])
+        self.as_of = max(as_of_date(s) for s in stores)
+        self.sectors = df["fund_vertical"].value_counts(normalize=True)
+        self.industries = df["issuer_industry_group"].value_counts(normalize=True)
+
+        self.log_amounts = np.log(df[["offering_amount_total", "total_amount_sold"]].to_numpy(dtype=float).clip(1))
+        self.amount_jitter = np.array([_bandwidth(c) for c in self.log_amounts.T])
+        self.investors = df["number_of_investors"].to_numpy()
+        self.sale_lag = (df["filing_date"] - df["date_of_first_sale"]).dt.days.to_numpy(dtype=float)
+
+        self.filings_per_fund = df.groupby("cik").size().to_numpy()
+        self.funds_per_gp = df.groupby("related_person_name")["cik"].nunique().to_numpy()
+        self.gp_names = df["related_person_name"].dropna().unique()
+        names = df["issuer_name"].drop_duplicates().str.split(" ", n=1)
+        self.name_heads = names.str[0].to_numpy()
+        self.name_tails = names.str[1].dropna().to_numpy()
+
+        dates = df["filing_date"].dropna()
+        self.month_weights = dates.dt.month.value_counts(normalize=True).reindex(range(1, 13), fill_value=0)
+        self.weekday_weights = dates.dt.weekday.value_counts(normalize=True).reindex(range(7), fill_value=0)
+
+    @classmethod
+    def from_outputs(cls, base_path: Path) -> "Profile":
+        return cls([read_store(p) for p in sorted(Path(base_path).glob(f"*/{INTENT_FILE.format(year='*')}"))])
+
+    def filing_days(self) -> tuple:
+        """``(days, probabilities)`` over the profile year: month share spread
+        over that month's days, weighted by weekday."""
+        days = pd.date_range(f"{self.year}-01-01", f"{self.year}-12-31")
+        weights = (
+            self.month_weights.to_numpy()[days.month - 1] / days.days_in_month.to_numpy()
+            * self.weekday_weights.to_numpy()[days.weekday]
+        )
+        return days, weights / weights.sum()
+
+
+def _group_sizes(sizes: np.ndarray, total: int, rng) -> np.ndarray:
+    """Group ids for ``total`` members, with group sizes drawn from ``sizes``."""
+    drawn = rng.choice(sizes, size=max(1, int(total / sizes.mean() * 1.2) + 1))
+    while drawn.sum() < total:
+        drawn = np.concatenate([drawn, rng.choice(sizes, size=len(drawn))])
+    return np.repeat(np.arange(len(drawn)), drawn)[:total]
+
+
+def generate(profile: Profile, rows: int, state: str, seed: int = 0) -> pd.DataFrame:
+    """Raw filing columns (``RAW_COLUMNS``) for ``rows`` synthetic filings."""
+    rng = np.random.default_rng(seed)
+
+    # Filings belong to funds and funds to GPs, with the fitted group sizes.
+    fund = _group_sizes(profile.filings_per_fund, rows, rng)
+    n_funds = fund[-1] + 1 if rows else 0
+    gp = rng.permutation(_group_sizes(profile.funds_per_gp, n_funds, rng))
+    gp_base = rng.choice(profile.gp_names, size=gp.max() + 1 if n_funds else 0)
+    gp_names = pd.Series(gp_base).str.cat(pd.Series(np.arange(len(gp_base))).astype(str))
+    cik = rng.integers(3_000_000_000, 8_000_000_000) + np.arange(n_funds)
+    fund_names = pd.Series(rng.choice(profile.name_heads, n_funds)).str.cat(
+        pd.Series(rng.choice(profile.name_tails, n_funds)), sep=" "
+    )
+
+    days, p = profile.filing_days()
+    filing_date = pd.DatetimeIndex(rng.choice(days, size=rows, p=p))
+    sample = rng.integers(0, len(profile.log_amounts), size=rows)
+    log_amounts = profile.log_amounts[sample] + rng.normal(size=(rows, 2)) * profile.amount_jitter
+    offering = np.exp(log_amounts[:, 0]).round()
+    sold = np.minimum(np.exp(log_amounts[:, 1]), offering).round().astype(np.int64)
+    lag = pd.to_timedelta(rng.choice(profile.sale_lag, size=rows), unit="D")
+
+    fund_cik = pd.Series(cik[fund]).astype(str).str.zfill(10)
+    sequence = pd.Series(fund).groupby(fund).cumcount() + 1
+    raw = pd.DataFrame({
+        "cik": fund_cik,
+        "filing_date": filing_date,
+        "issuer_name": fund_names.to_numpy()[fund],
+        "issuer_state": state,
+        "issuer_industry_group": rng.choice(profile.industries.index, size=rows, p=profile.industries.to_numpy()),
+        "offering_amount_total": offering,
+        "total_amount_sold": sold,
+        "number_of_investors": rng.choice(profile.investors, size=rows),
+        "date_of_first_sale": filing_date - lag,
+        "accession_number": fund_cik + f"-{profile.year % 100:02d}-" + sequence.astype(str).str.zfill(6),
+        "fund_vertical": rng.choice(profile.sectors.index, size=rows, p=profile.sectors.to_numpy()),
+        "related_person_name": gp_names.to_numpy()[gp[fund]],
+    })
+    return raw.sort_values("filing_date", kind="stable", ignore_index=True)[RAW_COLUMNS]
+
+
+def write_partition(profile: Profile, base_path: Path, state: str, rows: int, seed: int = 0) -> Path:
+    """Score a synthetic partition and write it as ``<base>/<STATE>/`` intent export."""
+    path = Path(base_path) / state / INTENT_FILE.format(year=profile.year)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_store(score_filings(generate(profile, rows, state, seed), profile.as_of), path)
+    return path
+
+
+if __name__ == "__main__":
+    from signaldeck.catalog import refresh
+    from signaldeck.snapshot import build_snapshot
+    from signaldeck.text_index import build_text_index
+    from signaldeck.timeseries import build_timeseries
+
+    root = Path(__file__).resolve().parent.parent
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, required=True, help="filings per state")
+    parser.add_argument("--states", nargs="+", default=["CA", "NY", "TX", "MA"])
+    parser.add_argument("--outputs", type=Path, default=root / "Outputs", help="exports to fit the profile to")
+    parser.add_argument("--out", type=Path, default=root / "Synthetic")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    profile = Profile.from_outputs(args.outputs)
+    for i, state in enumerate(args.states):
+        path = write_partition(profile, args.out, state, args.rows, args.seed + i)
+        build_snapshot(path)
+        build_timeseries(path)
+        build_text_index(path)
+        print(f"wrote {path.relative_to(args.out)}: {args.rows} rows")
+    refresh(args.out)
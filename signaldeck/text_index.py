@@ -0,0 +1,169 @@
+"""BM25 full-text index over the "Why This Investor" explanations.
+
+Each row of a dataset is one document. It holds the row's explanation, its
+fund name and its sector label, lowercased and split on anything that is
+not a letter or digit, with a short stop-word list removed. Postings are
+stored in CSR form (sorted term table, ``term_ptr``, ``docs``, ``tfs``)
+together with the document lengths.
+
+The index is written next to each dataset's snapshot, stamped with the
+same source stamp, whenever filings are ingested or rescored. It is
+rebuilt on load if it is stale. A query adds up the BM25 weights of its
+terms' postings with one ``bincount``, so it reads only the matching rows
+and never scans the text. When several states are searched, document
+frequencies and lengths are summed over all of them first, so scores are
+comparable across states.
+
+    python -m signaldeck.text_index    # (re)build every state's index
+"""
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from signaldeck.atomic import replacing
+from signaldeck.snapshot import load_snapshot, source_stamp
+
+INDEX_SUFFIX = ".text.npz"
+TEXT_COLUMNS = ["Why This Investor", "Fund Name", "Sector"]
+TOKEN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from i in is it of on or should that the this to was we what which who with"
+    .split()
+)
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text: str) -> list:
+    return [t for t in TOKEN.findall(text.lower()) if t not in STOPWORDS]
+
+
+class TextIndex:
+    """Term postings of one dataset, one document per row."""
+
+    def __init__(self, terms, term_ptr, docs, tfs, doc_len):
+        self.terms = terms
+        self.term_ptr = term_ptr
+        self.docs = docs
+        self.tfs = tfs
+        self.doc_len = doc_len
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "TextIndex":
+        text = pd.Series("", index=pd.RangeIndex(len(df)), dtype=object)
+        for column in TEXT_COLUMNS:
+            text = text + " " + df[column].astype(object).fillna("").astype(str).to_numpy()
+        tokens = text.str.lower().str.findall(TOKEN.pattern).explode()
+        tokens = tokens[tokens.notna() & ~tokens.isin(STOPWORDS)]
+        doc = tokens.index.to_numpy(dtype=np.int64)
+
+        codes, terms = pd.factorize(tokens.to_numpy(dtype=object), sort=True)
+        pairs, tfs = np.unique((codes.astype(np.int64) << 32) | doc, return_counts=True)
+        counts = np.bincount(pairs >> 32, minlength=len(terms))
+        return cls(
+            terms=np.asarray(terms, dtype=str),
+            term_ptr=np.concatenate([[0], np.cumsum(counts)]),
+            docs=(pairs & 0xFFFFFFFF).astype(np.int32),
+            tfs=tfs.astype(np.int32),
+            doc_len=np.bincount(doc, minlength=len(df)).astype(np.int32),
+        )
+
+    @property
+    def n_docs(self) -> int:
+        return len(self.doc_len)
+
+    def _slots(self, terms) -> np.ndarray:
+        """Term-table slot per term, -1 where the term does not occur."""
+        terms = np.asarray(terms, dtype=str)
+        slots = np.searchsorted(self.terms, terms)
+        found = (slots < len(self.terms)) & (self.terms[np.minimum(slots, len(self.terms) - 1)] == terms)
+        return np.where(found, slots, -1)
+
+    def doc_freq(self, terms) -> np.ndarray:
+        slots = self._slots(terms)
+        return np.where(slots >= 0, self.term_ptr[slots + 1] - self.term_ptr[np.maximum(slots, 0)], 0)
+
+    def scores(self, terms, n_docs=None, avg_len=None, doc_freq=None) -> np.ndarray:
+        """BM25 score of every row for ``terms``.
+
+        Corpus statistics default to this index alone; pass the totals from
+        :func:`corpus_stats` to score several datasets on one scale.
+        """
+        scores = np.zeros(self.n_docs)
+        if not len(terms) or not self.n_docs:
+            return scores
+        if n_docs is None:
+            n_docs, avg_len, doc_freq = corpus_stats([self], terms)
+        norm = K1 * (1 - B + B * self.doc_len / avg_len) if avg_len else np.full(self.n_docs, K1)
+        for slot, df in zip(self._slots(terms), doc_freq):
+            if slot < 0:
+                continue
+            docs = self.docs[self.term_ptr[slot]:self.term_ptr[slot + 1]]
+            tfs = self.tfs[self.term_ptr[slot]:self.term_ptr[slot + 1]]
+            idf = np.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            scores += np.bincount(docs, weights=idf * tfs * (K1 + 1) / (tfs + norm[docs]), minlength=self.n_docs)
+        return scores
+
+    def save(self, path: Path, stamp: bytes):
+        with replacing(path) as tmp, open(tmp, "wb") as out:
+            np.savez(out, terms=self.terms, term_ptr=self.term_ptr, docs=self.docs, tfs=self.tfs,
+                     doc_len=self.doc_len, stamp=np.frombuffer(stamp, dtype=np.uint8))
+
+    @classmethod
+    def load(cls, path: Path):
+        """``(index, stamp)`` from a saved index."""
+        with np.load(path) as data:
+            index = cls(data["terms"], data["term_ptr"], data["docs"], data["tfs"], data["doc_len"])
+            return index, data["stamp"].tobytes()
+
+
+def corpus_stats(indexes, terms) -> tuple:
+    """``(n_docs, avg_len, doc_freq)`` summed over ``indexes``."""
+    indexes = list(indexes)
+    n_docs = sum(ix.n_docs for ix in indexes)
+    total_len = sum(int(ix.doc_len.sum()) for ix in indexes)
+    doc_freq = sum((ix.doc_freq(terms) for ix in indexes), np.zeros(len(terms), dtype=np.int64))
+    return n_docs, (total_len / n_docs if n_docs else 0.0), doc_freq
+
+
+def relevance(partitions, terms, sectors=None, buckets=None, min_score=0.0) -> np.ndarray:
+    """BM25 scores aligned with ``filter_partitions(...)`` for ``(FilterIndex, TextIndex)`` pairs."""
+    partitions = list(partitions)
+    stats = corpus_stats((text for _, text in partitions), terms)
+    parts = [text.scores(terms, *stats)[index.select(sectors, buckets, min_score)] for index, text in partitions]
+    return np.concatenate(parts) if parts else np.empty(0)
+
+
+def index_path(csv_path: Path) -> Path:
+    return Path(csv_path).with_suffix(INDEX_SUFFIX)
+
+
+def build_text_index(csv_path: Path) -> Path:
+    """Write the index for one dataset, stamped like its snapshot."""
+    out = index_path(csv_path)
+    TextIndex.from_frame(load_snapshot(csv_path, columns=TEXT_COLUMNS)).save(out, source_stamp(csv_path))
+    return out
+
+
+def load_text_index(csv_path: Path) -> TextIndex:
+    """The index for one dataset, rebuilding it if the CSV has changed."""
+    try:
+        index, stamp = TextIndex.load(index_path(csv_path))
+        if stamp == source_stamp(csv_path):
+            return index
+    except (OSError, ValueError, KeyError):
+        pass
+    try:
+        return TextIndex.load(build_text_index(csv_path))[0]
+    except OSError:
+        return TextIndex.from_frame(load_snapshot(csv_path, columns=TEXT_COLUMNS))
+
+
+if __name__ == "__main__":
+    base = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).resolve().parent.parent / "Outputs"
+    for csv_path in sorted(base.glob("*/*.csv")):
+        if set(TEXT_COLUMNS) <= set(load_snapshot(csv_path).columns):
+            print(f"built {build_text_index(csv_path).relative_to(base)}")
@@ -0,0 +1,128 @@
+"""Deployment time-series cube behind "Investor Deployment Over Time".
+
+Recent capital is summed per sector, intent bucket, score bin (the 0.05
+grid of :mod:`signaldeck.cube`) and period, at weekly and monthly grain.
+The cube is written next to each dataset's snapshot when filings are
+ingested or rescored, and rebuilt on load if it is stale. A chart then
+sums the few hundred matching cells instead of grouping every filing.
+Quarters and years roll up from months; rolling windows run on the rolled
+up series.
+
+    python -m signaldeck.timeseries    # (re)build every state's cube
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from signaldeck.atomic import replacing
+from signaldeck.cube import first_bin, on_grid, score_bin
+from signaldeck.snapshot import STAMP_KEY, load_snapshot, source_stamp
+
+CUBE_SUFFIX = ".timeseries.arrow"
+CUBE_COLUMNS = ["Sector", "Intent Bucket", "Investor Intent Score", "Filing Date", "Recent Capital Deployed"]
+
+# Stored grains, and the grain each displayed period is rolled up from.
+GRAINS = {"W": "W-SUN", "MS": "MS"}
+PERIODS = {"Week": "W", "Month": "MS", "Quarter": "QS", "Year": "YS"}
+ROLLUP_SOURCE = {"W": "W", "MS": "MS", "QS": "MS", "YS": "MS"}
+# Trailing windows, in periods, offered on top of any displayed period.
+WINDOWS = {"Off": 1, "3 periods": 3, "6 periods": 6, "12 periods": 12}
+
+
+def _period_start(dates: pd.Series, grain: str) -> pd.Series:
+    # Weeks are labelled by their closing Sunday, as pd.Grouper(freq="W") does.
+    if grain == "W":
+        return dates.dt.to_period("W-SUN").dt.end_time.dt.normalize()
+    return dates.dt.to_period({"MS": "M", "QS": "Q", "YS": "Y"}[grain]).dt.start_time
+
+
+def build_cube(df: pd.DataFrame) -> pd.DataFrame:
+    """Capital per (grain, period, sector, bucket, score bin) from display rows."""
+    rows = df[df["Investor Intent Score"].notna() & df["Filing Date"].notna()]
+    bins = score_bin(rows["Investor Intent Score"].to_numpy(dtype=float))
+    cells = []
+    for grain in GRAINS:
+        keys = [_period_start(rows["Filing Date"], grain).rename("period"), rows["Sector"], rows["Intent Bucket"],
+                pd.Series(bins, index=rows.index, name="score_bin")]
+        cell = rows.groupby(keys, dropna=False, observed=True)["Recent Capital Deployed"].sum().reset_index()
+        cells.append(cell.assign(grain=grain))
+    cube = pd.concat(cells, ignore_index=True)
+    return cube.astype({"Sector": str, "Intent Bucket": str}).rename(columns={"Recent Capital Deployed": "capital"})
+
+
+def cube_path(csv_path: Path) -> Path:
+    return Path(csv_path).with_suffix(CUBE_SUFFIX)
+
+
+def build_timeseries(csv_path: Path) -> Path:
+    """Write the cube for one dataset, stamped like its snapshot."""
+    csv_path = Path(csv_path)
+    table = pa.Table.from_pandas(build_cube(load_snapshot(csv_path, columns=CUBE_COLUMNS)), preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), STAMP_KEY: source_stamp(csv_path)})
+    out = cube_path(csv_path)
+    with replacing(out) as tmp:
+        feather.write_feather(table, str(tmp), compression="uncompressed")
+    return out
+
+
+def load_timeseries(csv_path: Path) -> pd.DataFrame:
+    """The cube for one dataset, rebuilding it if the CSV has changed."""
+    path = cube_path(csv_path)
+    try:
+        table = feather.read_table(str(path))
+        if (table.schema.metadata or {}).get(STAMP_KEY) == source_stamp(csv_path):
+            return table.to_pandas()
+    except (OSError, pa.ArrowInvalid):
+        pass
+    try:
+        return feather.read_table(str(build_timeseries(csv_path))).to_pandas()
+    except OSError:
+        return build_cube(load_snapshot(csv_path, columns=CUBE_COLUMNS))
+
+
+def _fill(series: pd.Series, grain: str) -> pd.Series:
+    # Empty periods inside the range show as 0, matching a pd.Grouper.
+    if series.empty:
+        return series
+    index = pd.date_range(series.index.min(), series.index.max(), freq=GRAINS.get(grain, grain))
+    return series.reindex(index, fill_value=0.0).rename_axis("Filing Date")
+
+
+def deployment(cubes, sectors=None, buckets=None, min_score=0.0, period="MS"):
+    """Capital per period summed over the matching cells of ``cubes``.
+
+    Returns None when ``min_score`` is off the score grid.
+    """
+    if not on_grid(min_score):
+        return None
+    cube = pd.concat(list(cubes), ignore_index=True)
+    mask = (cube["grain"] == ROLLUP_SOURCE[period]) & (cube["score_bin"] >= first_bin(min_score))
+    if sectors:
+        mask &= cube["Sector"].isin(sectors)
+    if buckets:
+        mask &= cube["Intent Bucket"].isin(buckets)
+    cells = cube[mask]
+    periods = cells["period"] if period in GRAINS else _period_start(cells["period"], period)
+    series = cells.groupby(periods)["capital"].sum().rename("Recent Capital Deployed")
+    return _fill(series, period)
+
+
+def deployment_from_rows(df: pd.DataFrame, period="MS") -> pd.Series:
+    """The same series straight from filtered rows."""
+    grouper = pd.Grouper(key="Filing Date", freq=GRAINS.get(period, period))
+    return df.groupby(grouper)["Recent Capital Deployed"].sum()
+
+
+def rolling(series: pd.Series, window: int) -> pd.Series:
+    """Trailing ``window``-period sums of a deployment series."""
+    return series.rolling(window, min_periods=1).sum()
+
+
+if __name__ == "__main__":
+    base = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).resolve().parent.parent / "Outputs"
+    for csv_path in sorted(base.glob("*/*.csv")):
+        if set(CUBE_COLUMNS) <= set(load_snapshot(csv_path).columns):
+            print(f"built {build_timeseries(csv_path).relative_to(base)}")
@@ -0,0 +1,82 @@
+"""Concentration metrics against their direct formulas.
+
+Gini is the mean absolute difference over twice the mean, and HHI the
+sum of squared capital shares, both computed pairwise here without the
+single cumulative pass of :class:`Concentration`. Selections of the
+shipped ``Outputs/`` must match the same formulas over their filtered
+rows; empty selections and zero total capital give zeros.
+
+    python -m unittest discover tests
+"""
+import unittest
+
+import numpy as np
+
+from signaldeck import core
+from signaldeck.catalog import manifest_version
+from signaldeck.concentration import Concentration
+from test_fast_paths import OUTPUTS, selections
+
+CASES = 50
+
+
+def gini(values) -> float:
+    values = np.nan_to_num(np.asarray(values, dtype=float))
+    if not len(values) or values.sum() <= 0:
+        return 0.0
+    return np.abs(values[:, None] - values[None, :]).sum() / (2 * len(values) * values.sum())
+
+
+def hhi(values) -> float:
+    values = np.nan_to_num(np.asarray(values, dtype=float))
+    return float(((values / values.sum()) ** 2).sum()) if values.sum() > 0 else 0.0
+
+
+def descending(values) -> np.ndarray:
+    return np.sort(np.nan_to_num(np.asarray(values, dtype=float)))[::-1]
+
+
+class ConcentrationTest(unittest.TestCase):
+    def test_formulas(self):
+        rng = np.random.default_rng(0)
+        for _ in range(CASES):
+            values = descending(rng.lognormal(15, 2, int(rng.integers(1, 300))))
+            with self.subTest(size=len(values)):
+                result = Concentration(values)
+                self.assertAlmostEqual(result.gini, gini(values))
+                self.assertAlmostEqual(result.hhi, hhi(values))
+                self.assertAlmostEqual(result.top_share(10), values[:10].sum() / values.sum())
+
+    def test_equal_and_single(self):
+        self.assertAlmostEqual(Concentration(np.full(8, 5.0)).gini, 0.0)
+        self.assertAlmostEqual(Concentration(np.full(8, 5.0)).hhi, 1 / 8)
+        self.assertAlmostEqual(Concentration([7.0]).hhi, 1.0)
+
+    def test_empty(self):
+        result = Concentration([])
+        self.assertEqual((result.gini, result.hhi, result.top_share(10)), (0.0, 0.0, 0.0))
+        self.assertEqual(len(result.curve()[0]), 0)
+
+    def test_empty_selection(self):
+        catalog = core.load_catalog(str(OUTPUTS), manifest_version(OUTPUTS))
+        partitions = core.select_partitions(catalog, catalog.states(), None, (), (), 0.0)
+        result = core.load_concentration(partitions, ("no such sector",), (), 0.0)
+        self.assertEqual((result.n, result.gini, result.hhi), (0, 0.0, 0.0))
+
+    def test_zero_total(self):
+        result = Concentration(np.zeros(5))
+        self.assertEqual((result.gini, result.hhi, result.top_share(3)), (0.0, 0.0, 0.0))
+        np.testing.assert_array_equal(result.curve()[1], np.zeros(5))
+
+    def test_selections(self):
+        catalog = core.load_catalog(str(OUTPUTS), manifest_version(OUTPUTS))
+        for selection in selections(catalog, n=50):
+            with self.subTest(selection=selection[1:]):
+                capital = core.load_filtered(*selection)["Recent Capital Deployed"].to_numpy()
+                result = core.load_concentration(*selection)
+                self.assertAlmostEqual(result.gini, gini(capital))
+                self.assertAlmostEqual(result.hhi, hhi(capital))
+
+
+if __name__ == "__main__":
+    unittest.main()
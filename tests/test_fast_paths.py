@@ -0,0 +1,87 @@
+"""The pre-aggregated paths against the row-level computations they replace.
+
+Random sidebar selections over the shipped ``Outputs/`` must give the same
+metrics row, GP table and deployment series whether they are merged from
+the cubes and rollups or computed from the filtered rows. Medians come
+from t-digests and fund counts from HyperLogLog sketches, so those two
+are compared with a small tolerance; everything else must match.
+
+    python -m unittest discover tests
+"""
+import random
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from signaldeck import core
+from signaldeck.catalog import manifest_version
+from signaldeck.cube import SCORE_EDGES, summarize
+from signaldeck.gp_rollup import rollup
+from signaldeck.timeseries import PERIODS, deployment_from_rows
+
+OUTPUTS = Path(__file__).resolve().parent.parent / "Outputs"
+BUCKETS = ["🔥 Hot", "🟡 Warm", "❄️ Cold"]
+SELECTIONS = 200
+MEDIAN_TOLERANCE = 0.01
+FUNDS_TOLERANCE = 0.02
+
+
+def selections(catalog, n=SELECTIONS, seed=0):
+    """``(partitions, sectors, buckets, min_score)`` for random non-empty selections."""
+    rng = random.Random(seed)
+    states = catalog.states()
+    sectors = catalog.sectors(catalog.entries)
+    scores = [float(s) for s in SCORE_EDGES[:-4]]
+    for _ in range(n):
+        chosen_sectors = tuple(sorted(rng.sample(sectors, rng.randint(0, 3))))
+        chosen_buckets = tuple(sorted(rng.sample(BUCKETS, rng.randint(0, 2))))
+        min_score = rng.choice(scores)
+        partitions = core.select_partitions(
+            catalog, rng.sample(states, rng.randint(1, len(states))), None,
+            chosen_sectors, chosen_buckets, min_score,
+        )
+        if not core.load_filtered(partitions, chosen_sectors, chosen_buckets, min_score).empty:
+            yield partitions, chosen_sectors, chosen_buckets, min_score
+
+
+class FastPathTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        catalog = core.load_catalog(str(OUTPUTS), manifest_version(OUTPUTS))
+        cls.selections = list(selections(catalog))
+
+    def test_selections(self):
+        self.assertGreater(len(self.selections), SELECTIONS // 2)
+
+    def test_metrics(self):
+        for selection in self.selections:
+            with self.subTest(selection=selection[1:]):
+                merged = core.load_metrics(*selection)
+                rows = summarize(core.load_filtered(*selection))
+                self.assertEqual(merged.active, rows.active)
+                self.assertTrue(np.isclose(merged.capital, rows.capital))
+                self.assertLessEqual(abs(merged.median_score - rows.median_score), MEDIAN_TOLERANCE)
+                self.assertLessEqual(abs(merged.funds - rows.funds), FUNDS_TOLERANCE * rows.funds)
+
+    def test_gp_table(self):
+        for selection in self.selections:
+            with self.subTest(selection=selection[1:]):
+                merged = core.load_gp_table(*selection).sort_values("GP Name", ignore_index=True)
+                rows = rollup(core.load_filtered(*selection)).sort_values("GP Name", ignore_index=True)
+                pd.testing.assert_frame_equal(merged, rows, check_dtype=False)
+
+    def test_deployment(self):
+        for selection in self.selections:
+            filtered = core.load_filtered(*selection)
+            for period in PERIODS.values():
+                with self.subTest(selection=selection[1:], period=period):
+                    pd.testing.assert_series_equal(
+                        core.load_deployment(*selection, period), deployment_from_rows(filtered, period),
+                        check_dtype=False, check_names=False, check_freq=False,
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Incremental ingestion on a temporary copy of the shipped ``Outputs/``.
+
+A batch mixing an already stored filing with a new one must append only
+the new one to the state's filing set, leave the raw columns of existing
+rows untouched and age the whole store to the new ``as_of``. Ingesting
+the same batch again adds nothing, and an ``as_of`` before the newest
+filing is rejected.
+
+    python -m unittest discover tests
+"""
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from signaldeck.catalog import open_catalog
+from signaldeck.ingest import ingest, merge_filings
+from signaldeck.scoring import RAW_COLUMNS, as_of_date, read_store
+from test_fast_paths import OUTPUTS
+
+STATE = "NY"
+
+
+class IngestTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.outputs = Path(self.tmp.name) / "Outputs"
+        shutil.copytree(OUTPUTS, self.outputs, ignore=shutil.ignore_patterns("*.png"))
+        catalog = open_catalog(self.outputs)
+        self.relative = catalog.filing_set(STATE)["path"]
+        self.path = catalog.path(catalog.filing_set(STATE))
+        self.store = read_store(self.path)
+
+        latest = self.store[self.store["filing_date"] == self.store["filing_date"].max()]
+        new = latest[RAW_COLUMNS].tail(1).assign(accession_number="9999999999-25-000001")
+        self.batch = pd.concat([self.store[RAW_COLUMNS].head(1), new], ignore_index=True)
+        self.as_of = as_of_date(self.store) + pd.Timedelta(days=30)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_appends_new_filings_only(self):
+        self.assertEqual(ingest(self.outputs, self.batch, self.as_of), {self.relative: 1})
+        after = read_store(self.path)
+        self.assertEqual(len(after), len(self.store) + 1)
+        self.assertEqual(after["accession_number"].value_counts().max(), 1)
+        pd.testing.assert_frame_equal(after[RAW_COLUMNS].iloc[:len(self.store)], self.store[RAW_COLUMNS])
+
+        # the same batch again is all duplicates
+        self.assertEqual(ingest(self.outputs, self.batch, self.as_of), {})
+        pd.testing.assert_frame_equal(read_store(self.path), after)
+
+    def test_as_of_moves_forward(self):
+        ingest(self.outputs, self.batch, self.as_of)
+        after = read_store(self.path)
+        self.assertEqual(as_of_date(after), self.as_of)
+        pd.testing.assert_series_equal(
+            after["days_since_filing"].iloc[:len(self.store)], self.store["days_since_filing"] + 30,
+            check_dtype=False,
+        )
+
+    def test_as_of_defaults_to_today(self):
+        merged = merge_filings(self.store, self.batch)
+        self.assertEqual(as_of_date(merged), pd.Timestamp.today().normalize())
+
+    def test_rejects_as_of_before_newest_filing(self):
+        with self.assertRaises(ValueError):
+            ingest(self.outputs, self.batch, self.store["filing_date"].max() - pd.Timedelta(days=1))
+        pd.testing.assert_frame_equal(read_store(self.path), self.store)
+
+
+if __name__ == "__main__":
+    unittest.main()
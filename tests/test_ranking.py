@@ -0,0 +1,84 @@
+"""The linear-time ranking helpers against the pandas sorts they replace.
+
+``rank_order``, ``top_k`` and ``peer_percentiles`` are checked on seeded
+arrays full of ties and NaN, over random row subsets, and ``plan`` must
+give the same answer whether it walks the precomputed orders of the
+shipped ``Outputs/`` or sorts on the spot.
+
+    python -m unittest discover tests
+"""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from signaldeck import core
+from signaldeck.catalog import manifest_version
+from signaldeck.query import parse, plan
+from signaldeck.ranking import RANK_COLUMNS, peer_percentiles, rank_order, top_k
+from test_fast_paths import OUTPUTS, selections
+
+CASES = 50
+QUERIES = [
+    "largest funds", "fast fintech", "largest fast", "hot ai largest fast",
+    "big saas", "quick moving cold funds", "warm climate largest to email this week",
+    "largest fast health hot warm", "crypto", "reach out to fast hot funds",
+]
+
+
+def arrays(n=CASES, seed=0):
+    """Seeded float arrays with heavy ties and some NaN."""
+    rng = np.random.default_rng(seed)
+    for _ in range(n):
+        size = int(rng.integers(0, 200))
+        values = rng.integers(0, max(size // 4, 1), size).astype(float)
+        values[rng.random(size) < 0.1] = np.nan
+        yield values
+
+
+def pandas_order(values) -> np.ndarray:
+    return pd.Series(values).sort_values(ascending=False, kind="stable", na_position="last").index.to_numpy()
+
+
+class RankingTest(unittest.TestCase):
+    def test_rank_order(self):
+        for values in arrays():
+            with self.subTest(size=len(values)):
+                np.testing.assert_array_equal(rank_order(values), pandas_order(values))
+
+    def test_top_k(self):
+        for values in arrays():
+            for k in (0, 1, 5, len(values) // 2, len(values), len(values) + 3):
+                with self.subTest(size=len(values), k=k):
+                    np.testing.assert_array_equal(top_k(values, k), pandas_order(values)[:max(k, 0)])
+
+    def test_peer_percentiles(self):
+        rng = np.random.default_rng(1)
+        for values in arrays():
+            for size in (0, 1, len(values) // 3, len(values)):
+                peers = np.sort(rng.choice(len(values), size, replace=False))
+                with self.subTest(size=len(values), peers=size):
+                    np.testing.assert_allclose(
+                        peer_percentiles(values, rank_order(values), peers),
+                        pd.Series(values[peers]).rank(pct=True).to_numpy(),
+                    )
+
+
+class PlanTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        catalog = core.load_catalog(str(OUTPUTS), manifest_version(OUTPUTS))
+        cls.selections = list(selections(catalog))
+
+    def test_orders(self):
+        for selection in self.selections:
+            filtered = core.load_filtered(*selection)
+            orders = {col: core.load_rank_order(*selection, col) for col in RANK_COLUMNS}
+            for query in QUERIES:
+                intent = parse(query)
+                with self.subTest(selection=selection[1:], query=query):
+                    np.testing.assert_array_equal(plan(filtered, intent, orders), plan(filtered, intent))
+
+
+if __name__ == "__main__":
+    unittest.main()
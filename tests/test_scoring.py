@@ -0,0 +1,42 @@
+"""The scoring engine against the shipped exports.
+
+Rescoring the raw columns of each state's filing set in ``Outputs/``
+must reproduce every derived column of the export: numbers to within
+``TOLERANCE``, and buckets and explanations exactly.
+
+    python -m unittest discover tests
+"""
+import unittest
+
+import pandas as pd
+
+from signaldeck.catalog import open_catalog
+from signaldeck.scoring import STORE_COLUMNS, read_store, score_filings
+from test_fast_paths import OUTPUTS
+
+TOLERANCE = 1e-6
+
+
+class ScoringTest(unittest.TestCase):
+    def test_reproduces_exports(self):
+        catalog = open_catalog(OUTPUTS)
+        entries = catalog.filing_sets()
+        self.assertTrue(entries)
+        for entry in entries:
+            with self.subTest(path=entry["path"]):
+                store = read_store(catalog.path(entry))
+                scored = score_filings(store)
+                self.assertEqual(list(scored.columns), STORE_COLUMNS)
+                for column in STORE_COLUMNS:
+                    if pd.api.types.is_numeric_dtype(store[column]):
+                        pd.testing.assert_series_equal(
+                            scored[column], store[column], check_dtype=False, rtol=0, atol=TOLERANCE,
+                        )
+                    else:
+                        pd.testing.assert_series_equal(
+                            scored[column].astype(store[column].dtype), store[column], check_dtype=False,
+                        )
+
+
+if __name__ == "__main__":
+    unittest.main()